@@ -3,42 +3,199 @@
 Hydrus Sub Monitor - MVC Version
 A PyQt6 application for monitoring Hydrus subscription queries
 """
+import hashlib
+import importlib
+import logging
+import os
+import pickle
 import sys
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QCoreApplication
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
 
-from src.models.config import AppConfig
-from src.views.main_window import MainWindow
-from src.utils.logger import logger
+# Same logger the project's Logger wrapper configures; its file and console
+# handlers are attached when src.utils.logger is first imported, which the
+# preload thread and the config load both trigger early in startup
+logger = logging.getLogger("HydrusSubMonitor")
+
+APP_NAME = "Hydrus Sub Monitor"
+APP_VERSION = "2.0"
+CONFIG_PATH = "config.json"
+CONFIG_CACHE_DIR = Path.home() / ".cache" / "hydrus-sub-monitor"
+
+# Read by Qt once at startup, so they must be set before PyQt6 is imported
+QT_ENVIRONMENT = {
+    "QT_ENABLE_HIGHDPI_SCALING": "1",
+}
+
+
+def _config_cache_key(config_bytes: bytes) -> str:
+    """SHA-256 of the config file, the app version and the config dataclass fields"""
+    from dataclasses import fields
+    from src.models.config import AppConfig
+    
+    # A pickle made by a build with other fields would come back without the
+    # new attributes (unpickling skips __init__ and __post_init__)
+    digest = hashlib.sha256(APP_VERSION.encode())
+    for section in fields(AppConfig):
+        section_fields = ",".join(f.name for f in fields(section.default_factory))
+        digest.update(f"{section.name}({section_fields});".encode())
+    digest.update(config_bytes)
+    return digest.hexdigest()
+
+
+def load_config_cached(config_path: str = CONFIG_PATH, config_bytes: Optional[bytes] = None):
+    """Load configuration, reusing a pickled copy keyed by the file and config schema"""
+    from src.models.config import AppConfig
+    
+    if config_bytes is None:
+        try:
+            config_bytes = Path(config_path).read_bytes()
+        except OSError:
+            # Missing config file - let AppConfig create the default one
+            return AppConfig.load_from_file(config_path)
+    
+    digest = _config_cache_key(config_bytes)
+    cache_file = CONFIG_CACHE_DIR / f"config.{digest}.pkl"
+    try:
+        config = pickle.loads(cache_file.read_bytes())
+        if isinstance(config, AppConfig):
+            return config
+    except Exception:
+        pass  # No usable cache entry
+    
+    try:
+        config = AppConfig.from_bytes(config_bytes)
+    except Exception:
+        # Same fallback as AppConfig.load_from_file
+        return AppConfig()
+    
+    try:
+        CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(pickle.dumps(config))
+        # Only the entry for the current file is ever read again
+        for stale_file in CONFIG_CACHE_DIR.glob("config.*.pkl"):
+            if stale_file != cache_file:
+                stale_file.unlink(missing_ok=True)
+    except Exception as e:
+        logger.warning("Failed to write config cache: %s", e)
+    return config
+
+
+def apply_app_metadata(app) -> None:
+    """Set application name, version and organization on the QApplication"""
+    app.setApplicationName(APP_NAME)
+    app.setApplicationVersion(APP_VERSION)
+    app.setOrganizationName("HydrusSubMonitor")
+
+
+def handle_info_flags(args) -> None:
+    """Answer --help/--version and exit before Qt or the app modules are imported"""
+    if not any(arg in ("-h", "--help", "--version") for arg in args):
+        return
+    
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog="app.py",
+        description="A PyQt6 application for monitoring Hydrus subscription queries"
+    )
+    parser.add_argument("--version", action="version", version=f"{APP_NAME} {APP_VERSION}")
+    parser.parse_known_args(args)
 
 
 def main():
     """Main application entry point"""
-    # Set application metadata
-    QCoreApplication.setApplicationName("Hydrus Sub Monitor")
-    QCoreApplication.setApplicationVersion("2.0")
-    QCoreApplication.setOrganizationName("HydrusSubMonitor")
+    argv = sys.argv[:]
+    handle_info_flags(argv[1:])
+    
+    for name, value in QT_ENVIRONMENT.items():
+        os.environ.setdefault(name, value)
+    
+    # Qt binds its main thread to whichever thread loads it first, so the
+    # bindings must be imported here before any worker thread starts
+    from PyQt6.QtWidgets import QApplication, QSplashScreen
+    from PyQt6.QtCore import Qt, QTimer
+    from PyQt6.QtGui import QColor, QFontDatabase, QPixmap
+    
+    # Import the view layer in the background while Qt initializes
+    preload = threading.Thread(
+        target=importlib.import_module, args=("src.views.main_window",), daemon=True
+    )
+    preload.start()
+    
+    # Read the config file on a worker thread while Qt initializes
+    config_reader = ThreadPoolExecutor(max_workers=1)
+    config_future = config_reader.submit(Path(CONFIG_PATH).read_bytes)
+    config_reader.shutdown(wait=False)
+    
+    app = QApplication(argv)
+    apply_app_metadata(app)
     
     # Load configuration
-    config = AppConfig.load_from_file()
-    logger.info("Application starting")
-    logger.info(f"API enabled: {config.api.enabled}")
-    logger.info(f"Database path: {config.database.db_path}")
+    try:
+        config_bytes = config_future.result()
+    except OSError:
+        config_bytes = None
+    config = load_config_cached(config_bytes=config_bytes)
     
-    app = QApplication(sys.argv)
+    # Populate the font database (fontconfig scan) off the main thread;
+    # QFontDatabase's static functions are thread-safe
+    threading.Thread(target=QFontDatabase.families, daemon=True).start()
     
-    # Create and show main window
-    window = MainWindow(config)
-    window.show()
+    # Log uncaught exceptions instead of wrapping the event loop in try/except
+    def _excepthook(exc_type, exc_value, exc_traceback):
+        logger.critical("Application crashed: %s", exc_value)
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
     
-    logger.info("Main window displayed")
+    sys.excepthook = _excepthook
+    
+    # Lightweight splash shown while the main window is being built
+    splash_pixmap = QPixmap(360, 120)
+    splash_pixmap.fill(QColor("#e3f2fd"))
+    splash = QSplashScreen(splash_pixmap)
+    splash.showMessage("Loading Hydrus Sub Monitor...", Qt.AlignmentFlag.AlignCenter)
+    splash.show()
+    app.processEvents()
+    
+    # Startup logging runs on the first event loop tick, after the first paint
+    def _log_startup_info():
+        logger.info("Application starting")
+        logger.info("API enabled: %s", config.api.enabled)
+        logger.info("Database path: %s", config.database.db_path)
+        logger.info("Main window displayed")
+    
+    window = None
+    
+    def _build_window():
+        nonlocal window
+        try:
+            # Views, controllers and models are only imported once Qt is up
+            preload.join()
+            from src.views.main_window import MainWindow
+            
+            window = MainWindow(config)
+        except Exception as e:
+            logger.critical("Failed to create main window: %s", e)
+            splash.close()
+            app.exit(1)
+            return
+        
+        window.show()
+        splash.finish(window)
+        QTimer.singleShot(0, _log_startup_info)
+    
+    # Build the main window once the event loop has painted the splash
+    QTimer.singleShot(0, _build_window)
     
     # Run the application
-    try:
-        sys.exit(app.exec())
-    except Exception as e:
-        logger.critical(f"Application crashed: {str(e)}")
-        raise
+    exit_code = app.exec()
+    
+    # Flush logs and stdio, then skip interpreter teardown of the Qt object graph
+    logging.shutdown()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -1,24 +1,63 @@
 #!/usr/bin/env python3
 import sys
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import sqlite3
 import datetime
+import threading
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QLabel, QPushButton, QTextEdit, QTreeWidget, 
                             QTreeWidgetItem, QSplitter, QMessageBox, QScrollArea, QFrame, QComboBox)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSettings
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QBrush, QColor
+
+@lru_cache(maxsize=8192)
+def _format_ts(timestamp):
+    """Format a Unix timestamp, memoized since check times repeat across queries"""
+    return datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+# Display text shared by every tree row; flags are 0/1 or bool, which hash alike,
+# and anything else (e.g. a NULL column) shows as "No"
+_YESNO = {True: "Yes", False: "No"}
+_NEVER = "Never"
+
+# Keys of the query dicts returned by load_subscription_data, in SELECT order
+QUERY_FIELDS = (
+    'id', 'query_text', 'human_name', 'display_name',
+    'last_check_time', 'next_check_time', 'next_check_status',
+    'paused', 'dead', 'checking_now', 'can_check_now',
+    'checker_status', 'file_seed_cache_status', 'last_file_time',
+    'acknowledged', 'acknowledged_time'
+)
 
 class DatabaseManager:
     def __init__(self, db_path="hydrus_subscriptions.db"):
         self.db_path = db_path
+        
+        # One long-lived connection shared by the GUI and the API worker thread;
+        # autocommit mode so writes open their transactions explicitly
+        self._lock = threading.Lock()
+        self._conn = self.connect(check_same_thread=False, isolation_level=None, cached_statements=256)
         self.init_database()
     
+    def connect(self, **kwargs):
+        """Open a connection with the per-connection performance PRAGMAs applied"""
+        conn = sqlite3.connect(self.db_path, **kwargs)
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")
+        conn.execute("PRAGMA busy_timeout = 30000")
+        return conn
+    
     def init_database(self):
         """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
+        
+        # WAL lets the UI read while the API worker writes (persists in the file)
+        cursor.execute("PRAGMA journal_mode = WAL")
         
         # Create subscriptions table
         cursor.execute('''
@@ -71,159 +110,256 @@ class DatabaseManager:
         except sqlite3.OperationalError:
             pass
         
-        conn.commit()
-        conn.close()
+        # Lookup indexes for the natural keys used by save_subscription_data. The file
+        # is shared with the MVC app, which allows duplicate subscription names, so
+        # these are plain (non-unique) indexes that either schema can create
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_subscriptions_name_lookup ON subscriptions (name)")
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_queries_sub_text_human
+            ON queries (subscription_id, query_text, human_name)
+        ''')
+        
+        # idx_subscriptions_name_lookup and idx_queries_sub_text_human above already serve the
+        # load JOIN on subscription_id and the ORDER BY name, query_text
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_queries_last_file_time ON queries(last_file_time)")
+    
+    @contextmanager
+    def write_transaction(self):
+        """Run a block of writes in one transaction on the shared connection"""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+    
+    def close(self):
+        """Close the shared database connection"""
+        with self._lock:
+            self._conn.close()
     
     def save_subscription_data(self, data):
-        """Save API data to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            # Clear existing data
-            cursor.execute("DELETE FROM queries")
-            cursor.execute("DELETE FROM subscriptions")
+        """Save API data to database, updating existing rows in place"""
+        with self._lock:
+            cursor = self._conn.cursor()
             
-            subscriptions = data.get('subscriptions', [])
-            
-            for sub in subscriptions:
-                # Insert subscription
-                cursor.execute('''
+            try:
+                # Single write transaction for the whole refresh
+                cursor.execute("BEGIN IMMEDIATE")
+                
+                subscriptions = data.get('subscriptions', [])
+                now = datetime.datetime.now()
+                
+                # Upsert subscriptions by name, keeping their ids stable. Names are not
+                # unique in the shared schema, so this is an UPDATE plus an INSERT of the
+                # missing names rather than INSERT ... ON CONFLICT
+                sub_rows = [
+                    (sub.get('name', 'Unknown'), sub.get('gug_name', ''), now)
+                    for sub in subscriptions
+                ]
+                cursor.executemany(
+                    "UPDATE subscriptions SET gug_name = ?, updated_at = ? WHERE name = ?",
+                    ((gug_name, updated_at, name) for name, gug_name, updated_at in sub_rows)
+                )
+                cursor.executemany('''
                     INSERT INTO subscriptions (name, gug_name, updated_at)
-                    VALUES (?, ?, ?)
-                ''', (
-                    sub.get('name', 'Unknown'),
-                    sub.get('gug_name', ''),
-                    datetime.datetime.now()
-                ))
+                    SELECT ?, ?, ? WHERE NOT EXISTS (SELECT 1 FROM subscriptions WHERE name = ?)
+                ''', (row + row[:1] for row in sub_rows))
                 
-                sub_id = cursor.lastrowid
+                # Rows sharing a name (written by the MVC app) collapse onto the oldest;
+                # the others are dropped below as no longer present
+                cursor.execute("SELECT name, MIN(id) FROM subscriptions GROUP BY name")
+                name_to_id = dict(cursor.fetchall())
                 
-                # Insert queries for this subscription
-                queries = sub.get('queries', [])
-                for query in queries:
-                    cursor.execute('''
-                        INSERT INTO queries (
-                            subscription_id, query_text, human_name, display_name,
-                            last_check_time, next_check_time, next_check_status,
-                            paused, dead, checking_now, can_check_now, checker_status,
-                            file_velocity_data, file_seed_cache_status, last_file_time, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        sub_id,
-                        query.get('query_text', ''),
-                        query.get('human_name', ''),
-                        query.get('display_name', ''),
-                        query.get('last_check_time', 0),
-                        query.get('next_check_time', 0),
-                        query.get('next_check_status', ''),
-                        query.get('paused', False),
-                        query.get('dead', False),
-                        query.get('checking_now', False),
-                        query.get('can_check_now', False),
-                        query.get('checker_status', 0),
-                        json.dumps(query.get('file_velocity', [])),
-                        query.get('file_seed_cache_status', ''),
-                        query.get('last_file_time', 0),
-                        datetime.datetime.now()
-                    ))
-            
-            conn.commit()
-            return True
+                query_rows = []
+                for sub in subscriptions:
+                    sub_id = name_to_id[sub.get('name', 'Unknown')]
+                    for query in sub.get('queries', []):
+                        g = query.get
+                        query_rows.append((
+                            sub_id,
+                            g('query_text', ''),
+                            g('human_name', ''),
+                            g('display_name', ''),
+                            g('last_check_time', 0),
+                            g('next_check_time', 0),
+                            g('next_check_status', ''),
+                            g('paused', False),
+                            g('dead', False),
+                            g('checking_now', False),
+                            g('can_check_now', False),
+                            g('checker_status', 0),
+                            json.dumps(g('file_velocity', [])),
+                            g('file_seed_cache_status', ''),
+                            g('last_file_time', 0),
+                            now
+                        ))
+                
+                # Upsert queries the same way; acknowledgment columns are left untouched
+                cursor.executemany('''
+                    UPDATE queries SET
+                        human_name = ?, display_name = ?,
+                        last_check_time = ?, next_check_time = ?, next_check_status = ?,
+                        paused = ?, dead = ?, checking_now = ?, can_check_now = ?, checker_status = ?,
+                        file_velocity_data = ?, file_seed_cache_status = ?, last_file_time = ?, updated_at = ?
+                    WHERE subscription_id = ? AND query_text = ?
+                ''', (row[2:] + row[:2] for row in query_rows))
+                cursor.executemany('''
+                    INSERT INTO queries (
+                        subscription_id, query_text, human_name, display_name,
+                        last_check_time, next_check_time, next_check_status,
+                        paused, dead, checking_now, can_check_now, checker_status,
+                        file_velocity_data, file_seed_cache_status, last_file_time, updated_at
+                    )
+                    SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+                    WHERE NOT EXISTS (SELECT 1 FROM queries WHERE subscription_id = ? AND query_text = ?)
+                ''', (row + row[:2] for row in query_rows))
+                
+                # Delete only rows that are no longer present in the API data
+                cursor.execute("CREATE TEMP TABLE seen_subscriptions (id INTEGER PRIMARY KEY)")
+                cursor.execute('''
+                    CREATE TEMP TABLE seen_queries (
+                        subscription_id INTEGER,
+                        query_text TEXT,
+                        PRIMARY KEY (subscription_id, query_text)
+                    )
+                ''')
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO seen_subscriptions (id) VALUES (?)",
+                    ((name_to_id[row[0]],) for row in sub_rows)
+                )
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO seen_queries (subscription_id, query_text) VALUES (?, ?)",
+                    (row[:2] for row in query_rows)
+                )
+                cursor.execute('''
+                    DELETE FROM queries WHERE NOT EXISTS (
+                        SELECT 1 FROM seen_queries s
+                        WHERE s.subscription_id = queries.subscription_id
+                        AND s.query_text = queries.query_text
+                    )
+                ''')
+                cursor.execute("DELETE FROM subscriptions WHERE id NOT IN (SELECT id FROM seen_subscriptions)")
+                cursor.execute("DROP TABLE temp.seen_subscriptions")
+                cursor.execute("DROP TABLE temp.seen_queries")
+                
+                self._conn.commit()
+                return True
             
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+            except Exception as e:
+                self._conn.rollback()
+                raise e
     
     def load_subscription_data(self):
         """Load subscription data from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            # Get all subscriptions with their queries
-            cursor.execute('''
-                SELECT s.id, s.name, s.gug_name, s.updated_at,
-                       q.id, q.query_text, q.human_name, q.display_name,
-                       q.last_check_time, q.next_check_time, q.next_check_status,
-                       q.paused, q.dead, q.checking_now, q.can_check_now,
-                       q.checker_status, q.file_velocity_data, q.file_seed_cache_status, q.last_file_time,
-                       q.acknowledged, q.acknowledged_time
-                FROM subscriptions s
-                LEFT JOIN queries q ON s.id = q.subscription_id
-                ORDER BY s.name, q.query_text
-            ''')
-            
-            rows = cursor.fetchall()
-            
-            # Group data by subscription
-            subscriptions_dict = {}
-            
-            for row in rows:
-                sub_id = row[0]
-                if sub_id not in subscriptions_dict:
+        with self._lock:
+            cursor = self._conn.cursor()
+            
+            try:
+                # Subscriptions in name order for the filter buttons
+                cursor.execute("SELECT id, name, gug_name FROM subscriptions ORDER BY name")
+                
+                subscriptions_dict = {}
+                for sub_id, name, gug_name in cursor.fetchall():
                     subscriptions_dict[sub_id] = {
-                        'name': row[1],
-                        'gug_name': row[2],
-                        'queries': []
+                        'id': sub_id,
+                        'name': name,
+                        'gug_name': gug_name,
+                        'queries': [],
+                        'time_bounds': (0, 0)
                     }
                 
-                # Add query if it exists (LEFT JOIN might have NULL queries)
-                if row[5] is not None:  # query_text
-                    query_data = {
-                        'id': row[4],
-                        'query_text': row[5],
-                        'human_name': row[6],
-                        'display_name': row[7],
-                        'last_check_time': row[8],
-                        'next_check_time': row[9],
-                        'next_check_status': row[10],
-                        'paused': bool(row[11]),
-                        'dead': bool(row[12]),
-                        'checking_now': bool(row[13]),
-                        'can_check_now': bool(row[14]),
-                        'checker_status': row[15],
-                        'file_velocity': json.loads(row[16]) if row[16] else [],
-                        'file_seed_cache_status': row[17],
-                        'last_file_time': row[18],
-                        'acknowledged': bool(row[19]) if row[19] is not None else False,
-                        'acknowledged_time': row[20] if row[20] is not None else 0
-                    }
-                    subscriptions_dict[sub_id]['queries'].append(query_data)
-            
-            return {
-                'subscriptions': list(subscriptions_dict.values()),
-                'version': 80,  # Default version
-                'hydrus_version': 'From Database'
-            }
-            
-        except Exception as e:
-            return {'subscriptions': [], 'version': 80, 'hydrus_version': 'Database Error'}
-        finally:
-            conn.close()
+                time_bounds, sub_bounds = self._query_time_bounds(cursor)
+                for sub_id, bounds in sub_bounds.items():
+                    if sub_id in subscriptions_dict:
+                        subscriptions_dict[sub_id]['time_bounds'] = bounds
+                
+                # Queries in display order:
+                # 1. Normal queries (have last_file_time > 0) - sorted by last_file_time (oldest first)
+                # 2. "Never" queries (last_file_time = 0) - at bottom but above acknowledged
+                # 3. Acknowledged queries - at very bottom, ordered the same way
+                cursor.execute('''
+                    SELECT q.id, q.query_text, q.human_name, q.display_name,
+                           COALESCE(q.last_check_time, 0), COALESCE(q.next_check_time, 0), q.next_check_status,
+                           COALESCE(q.paused, 0), COALESCE(q.dead, 0),
+                           COALESCE(q.checking_now, 0), COALESCE(q.can_check_now, 0),
+                           q.checker_status, q.file_seed_cache_status, COALESCE(q.last_file_time, 0),
+                           COALESCE(q.acknowledged, 0), COALESCE(q.acknowledged_time, 0), q.subscription_id
+                    FROM queries q
+                    JOIN subscriptions s ON s.id = q.subscription_id
+                    ORDER BY COALESCE(q.acknowledged, 0), COALESCE(q.last_file_time, 0) = 0,
+                             COALESCE(q.last_file_time, 0), s.name, q.query_text
+                ''')
+                
+                # Flat (subscription name, query) list, already sorted for the tree
+                ordered_queries = []
+                
+                # Flag and time columns come back as 0/1 and ints (NULLs folded to 0 by the
+                # SELECT), so every key is present and usable as-is; zip stops before subscription_id
+                for row in cursor:
+                    sub = subscriptions_dict[row[-1]]
+                    query_data = dict(zip(QUERY_FIELDS, row))
+                    sub['queries'].append(query_data)
+                    ordered_queries.append((sub['name'], query_data))
+                
+                return {
+                    'subscriptions': list(subscriptions_dict.values()),
+                    'queries': ordered_queries,
+                    'time_bounds': time_bounds,
+                    'version': 80,  # Default version
+                    'hydrus_version': 'From Database'
+                }
+                
+            except Exception as e:
+                return {'subscriptions': [], 'queries': [], 'time_bounds': (0, 0), 'version': 80, 'hydrus_version': 'Database Error'}
+    
+    def _query_time_bounds(self, cursor):
+        """Oldest/newest file time of unacknowledged queries, overall and per subscription id"""
+        cursor.execute('''
+            SELECT subscription_id, MIN(last_file_time), MAX(last_file_time)
+            FROM queries
+            WHERE last_file_time > 0 AND COALESCE(acknowledged, 0) = 0
+            GROUP BY subscription_id
+        ''')
+        
+        time_bounds = None
+        sub_bounds = {}
+        for sub_id, min_time, max_time in cursor.fetchall():
+            sub_bounds[sub_id] = (min_time, max_time)
+            if time_bounds is None:
+                time_bounds = (min_time, max_time)
+            else:
+                time_bounds = (min(time_bounds[0], min_time), max(time_bounds[1], max_time))
+        
+        return time_bounds or (0, 0), sub_bounds
+    
+    def load_time_bounds(self):
+        """Load only the color-scale time bounds (see _query_time_bounds)"""
+        with self._lock:
+            return self._query_time_bounds(self._conn.cursor())
 
 class ApiWorker(QThread):
     data_received = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, http):
         super().__init__()
-        self.api_key = "80d06c01ec7f96ba3fcf22493acdccd0e899d2f87767c80e1bc46acaa0887eec"
         self.db_manager = db_manager
+        self.http = http  # Shared requests.Session carrying the API key header
     
     def run(self):
         try:
-            headers = {"Hydrus-Client-API-Access-Key": self.api_key}
-            response = requests.get(
+            response = self.http.get(
                 'http://127.0.0.1:45869/get_subscriptions',
-                headers=headers,
                 timeout=10
             )
             
             if response.status_code == 200:
-                data = response.json()
+                # Parse the raw bytes directly rather than decoding to text first
+                data = json.loads(response.content)
                 # Save to database
                 self.db_manager.save_subscription_data(data)
                 self.data_received.emit(data)
@@ -235,6 +371,20 @@ class ApiWorker(QThread):
         except Exception as e:
             self.error_occurred.emit(f"Unexpected error: {str(e)}")
 
+class QueryItem(QTreeWidgetItem):
+    """Tree row that sorts on raw values instead of display text"""
+    __slots__ = ('_raw', '_ack')
+    
+    def __lt__(self, other):
+        tree = self.treeWidget()
+        if self._ack != other._ack:
+            # Acknowledged queries stay below the rest whichever column and direction is sorted;
+            # a descending sort reverses the result, so the tier comparison is inverted for it
+            descending = tree.header().sortIndicatorOrder() == Qt.SortOrder.DescendingOrder
+            return (self._ack > other._ack) if descending else (self._ack < other._ack)
+        col = tree.sortColumn()
+        return self._raw.get(col, self.text(col)) < other._raw.get(col, other.text(col))
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -251,6 +401,11 @@ class MainWindow(QMainWindow):
         # Initialize database
         self.db_manager = DatabaseManager()
         
+        # Reuse one keep-alive HTTP connection to the Hydrus API across refreshes
+        self.http = requests.Session()
+        self.http.headers["Hydrus-Client-API-Access-Key"] = "80d06c01ec7f96ba3fcf22493acdccd0e899d2f87767c80e1bc46acaa0887eec"
+        self.http.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        
         # Create central widget and layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -307,16 +462,32 @@ class MainWindow(QMainWindow):
         left_layout.addWidget(sub_label)
         
         # Scroll area for subscription buttons
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.subscription_scroll_area = QScrollArea()
+        self.subscription_scroll_area.setWidgetResizable(True)
+        self.subscription_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # Parsed once here and inherited by every subscription button
+        self.subscription_scroll_area.setStyleSheet("""
+            QPushButton {
+                text-align: left;
+                padding: 8px;
+                border: 1px solid #ccc;
+                background-color: #f9f9f9;
+            }
+            QPushButton:hover {
+                background-color: #e3f2fd;
+                border: 1px solid #2196f3;
+            }
+            QPushButton:pressed {
+                background-color: #bbdefb;
+            }
+        """)
         
         self.subscription_buttons_widget = QWidget()
         self.subscription_buttons_layout = QVBoxLayout(self.subscription_buttons_widget)
         self.subscription_buttons_layout.setSpacing(2)
         
-        scroll_area.setWidget(self.subscription_buttons_widget)
-        left_layout.addWidget(scroll_area)
+        self.subscription_scroll_area.setWidget(self.subscription_buttons_widget)
+        left_layout.addWidget(self.subscription_scroll_area)
         
         # "Show All" button
         self.show_all_button = QPushButton("Show All Queries")
@@ -341,6 +512,10 @@ class MainWindow(QMainWindow):
         # Connect selection change to enable/disable buttons
         self.subscription_tree.itemSelectionChanged.connect(self.on_selection_changed)
         
+        # Debug tooltips are filled in on hover rather than for every row up front
+        self.subscription_tree.setMouseTracking(True)
+        self.subscription_tree.itemEntered.connect(self.on_item_entered)
+        
         # Enable sorting
         self.subscription_tree.setSortingEnabled(True)
         # Set initial sort by Last File Time column (index 3) in ascending order (oldest first)
@@ -362,6 +537,9 @@ class MainWindow(QMainWindow):
         
         # Store subscription data for filtering
         self.all_subscriptions_data = []
+        self.all_queries = []
+        self.time_bounds = (0, 0)
+        self.queries_by_id = {}
         self.current_filter = None
         
         # Add widgets to layout
@@ -380,7 +558,7 @@ class MainWindow(QMainWindow):
         self.refresh_button.setEnabled(False)
         self.text_area.append("Fetching subscription data from Hydrus API...")
         
-        self.api_worker = ApiWorker(self.db_manager)
+        self.api_worker = ApiWorker(self.db_manager, self.http)
         self.api_worker.data_received.connect(self.on_api_data_received)
         self.api_worker.error_occurred.connect(self.handle_api_error)
         self.api_worker.finished.connect(lambda: self.refresh_button.setEnabled(True))
@@ -404,16 +582,16 @@ class MainWindow(QMainWindow):
     
     def on_api_data_received(self, data):
         """Handle data received from API (already saved to database)"""
-        self.display_subscriptions(data)
+        # Display the saved rows so ids, acknowledgments and ordering come from the database
+        self.display_subscriptions(self.db_manager.load_subscription_data())
         self.text_area.append("Data updated from API and saved to database")
     
     def create_subscription_buttons(self, subscriptions):
         """Create buttons for each subscription"""
-        # Clear existing buttons
-        for i in reversed(range(self.subscription_buttons_layout.count())):
-            child = self.subscription_buttons_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
+        # Build the buttons on a fresh container; setWidget() below deletes the old one
+        buttons_widget = QWidget()
+        self.subscription_buttons_layout = QVBoxLayout(buttons_widget)
+        self.subscription_buttons_layout.setSpacing(2)
         
         # Create button for each subscription
         for sub in subscriptions:
@@ -422,28 +600,16 @@ class MainWindow(QMainWindow):
             
             button = QPushButton(f"{sub_name}\n({query_count} queries)")
             button.setMinimumHeight(50)
-            button.setStyleSheet("""
-                QPushButton {
-                    text-align: left;
-                    padding: 8px;
-                    border: 1px solid #ccc;
-                    background-color: #f9f9f9;
-                }
-                QPushButton:hover {
-                    background-color: #e3f2fd;
-                    border: 1px solid #2196f3;
-                }
-                QPushButton:pressed {
-                    background-color: #bbdefb;
-                }
-            """)
             
             # Connect button to filter function
-            button.clicked.connect(lambda checked, name=sub_name: self.filter_by_subscription(name))
+            button.clicked.connect(partial(self.filter_by_subscription, sub_name))
             self.subscription_buttons_layout.addWidget(button)
         
         # Add stretch to push buttons to top
         self.subscription_buttons_layout.addStretch()
+        
+        self.subscription_scroll_area.setWidget(buttons_widget)
+        self.subscription_buttons_widget = buttons_widget
     
     def filter_by_subscription(self, subscription_name):
         """Filter queries to show only those from the specified subscription"""
@@ -473,177 +639,202 @@ class MainWindow(QMainWindow):
         self.subscription_tree.setSortingEnabled(False)
         self.subscription_tree.clear()
         
-        subscriptions_to_show = self.all_subscriptions_data
+        queries_to_show = self.all_queries
         if self.current_filter:
-            subscriptions_to_show = [sub for sub in self.all_subscriptions_data if sub.get('name') == self.current_filter]
+            queries_to_show = [item for item in self.all_queries if item[0] == self.current_filter]
         
-        self.populate_query_table(subscriptions_to_show)
+        self.populate_query_table(queries_to_show, self.displayed_time_bounds())
         
-        # Keep sorting disabled to maintain our custom acknowledged-to-bottom order
-        # Users can still manually sort by clicking headers if needed
-        self.subscription_tree.setSortingEnabled(False)
+        # QueryItem keeps acknowledged queries at the bottom, so header sorting can stay on
+        self.subscription_tree.setSortingEnabled(True)
     
-    def get_orange_color_for_age(self, last_file_time, min_time, max_time):
-        """Calculate orange color based on file age - darker orange for older files"""
-        if last_file_time == 0:
-            # Dead/never files get a neutral gray
-            return QColor(240, 240, 240)
-        
-        if min_time == max_time:
-            # All files have same timestamp, use medium orange
-            return QColor(255, 220, 180)
-        
-        # Calculate age ratio (0 = newest, 1 = oldest)
-        age_ratio = (max_time - last_file_time) / (max_time - min_time)
-        
-        # Orange gradient: newer files = light orange, older files = dark orange
-        # Light orange: RGB(255, 240, 200) 
-        # Dark orange: RGB(255, 140, 60)
-        
-        red = 255  # Keep red constant
-        green = int(240 - (age_ratio * 100))  # 240 -> 140
-        blue = int(200 - (age_ratio * 140))   # 200 -> 60
-        
-        return QColor(red, green, blue)
-
-    def populate_query_table(self, subscriptions):
-        """Populate the table with queries from given subscriptions"""
-        # Collect all queries first to determine min/max last_file_time for color scaling
-        all_queries = []
-        for sub in subscriptions:
-            sub_name = sub.get('name', 'Unknown')
-            queries = sub.get('queries', [])
-            for query in queries:
-                all_queries.append((sub_name, query))
-        
-        # Debug: Print acknowledgment status before sorting
-        for sub_name, query in all_queries:
-            ack_status = query.get('acknowledged', False)
-            query_text = query.get('query_text', 'Unknown')
-            print(f"Query: {query_text}, Acknowledged: {ack_status}")
-        
-        # Sort queries with three tiers:
-        # 1. Normal queries (have last_file_time > 0) - sorted by last_file_time (oldest first)
-        # 2. "Never" queries (last_file_time = 0) - at bottom but above acknowledged
-        # 3. Acknowledged queries - at very bottom
-        def sort_key(item):
-            query = item[1]
-            acknowledged = query.get('acknowledged', False)
-            last_file_time = query.get('last_file_time', 0)
-            
-            if acknowledged:
-                return (2, last_file_time)  # Tier 2: Acknowledged (very bottom)
-            elif last_file_time == 0:
-                return (1, 0)  # Tier 1: Never files (bottom but above acknowledged)
+    def displayed_time_bounds(self):
+        """Color-scale time bounds of the current filter (all queries or one subscription)"""
+        if not self.current_filter:
+            return self.time_bounds
+        return next((sub.get('time_bounds', (0, 0)) for sub in self.all_subscriptions_data
+                     if sub.get('name') == self.current_filter), (0, 0))
+    
+    def row_brush_factory(self, time_bounds, now):
+        """Return a function mapping a row's status and last file time to its background brush"""
+        # Min and max last_file_time of the displayed queries (excluding 0/never and acknowledged), from the database
+        min_time, max_time = time_bounds
+        
+        # Colors that don't depend on the row are built once per refresh
+        acknowledged_color = QColor(200, 255, 200)  # Light green
+        dead_color = QColor(255, 200, 200)          # Light red
+        paused_color = QColor(230, 230, 230)        # Light gray
+        never_color = QColor(240, 240, 240)         # Neutral gray for never/dead files
+        flat_color = QColor(255, 220, 180)          # Medium orange when all files share a timestamp
+        time_span = max_time - min_time
+        brush_cache = {}  # One shared QBrush per distinct color
+        
+        def row_brush(acknowledged, ack_time, dead, paused, last_file):
+            # Color code based on status and last file time
+            if acknowledged and (ack_time == 0 or ack_time > now):
+                # Acknowledged queries get green color
+                final_color = acknowledged_color
+            elif dead:
+                # Dead queries get red color
+                final_color = dead_color
+            elif paused:
+                # Paused queries get gray color
+                final_color = paused_color
+            elif last_file == 0:
+                final_color = never_color
+            elif time_span == 0:
+                final_color = flat_color
             else:
-                return (0, last_file_time)  # Tier 0: Normal files (top, oldest first)
-        
-        all_queries.sort(key=sort_key)
-        
-        # Debug: Print order after sorting
-        print("After sorting:")
-        for i, (sub_name, query) in enumerate(all_queries):
-            ack_status = query.get('acknowledged', False)
-            query_text = query.get('query_text', 'Unknown')
-            print(f"{i}: {query_text}, Acknowledged: {ack_status}")
-        
-        # Find min and max last_file_time for color scaling ONLY from currently displayed queries (excluding 0/never and acknowledged)
-        valid_times = [q[1].get('last_file_time', 0) for q in all_queries 
-                      if q[1].get('last_file_time', 0) > 0 and not q[1].get('acknowledged', False)]
-        if valid_times:
-            min_time = min(valid_times)
-            max_time = max(valid_times)
-        else:
-            min_time = max_time = 0
+                # Orange gradient: newer files = light orange RGB(255, 240, 200),
+                # older files = dark orange RGB(255, 140, 60)
+                age_ratio = (max_time - last_file) / time_span  # 0 = newest, 1 = oldest
+                final_color = QColor(255, int(240 - (age_ratio * 100)), int(200 - (age_ratio * 140)))
+            
+            brush = brush_cache.get(final_color.rgb())
+            if brush is None:
+                brush = brush_cache[final_color.rgb()] = QBrush(final_color)
+            return brush
         
-        row_index = 0
+        return row_brush
+    
+    def ack_cells(self, acknowledged, ack_time, now):
+        """Text of the Acknowledged and Ack Until columns"""
+        if acknowledged and ack_time > 0:
+            ack_until_str = self.format_timestamp(ack_time) if ack_time > now else "Expired"
+        else:
+            ack_until_str = "N/A"
+        return _YESNO.get(acknowledged, "No"), ack_until_str
+    
+    def populate_query_table(self, all_queries, time_bounds):
+        """Populate the table with (subscription name, query) pairs, already in display order"""
         now = int(datetime.datetime.now().timestamp())
+        items = []
+        
+        row_brush = self.row_brush_factory(time_bounds, now)
+        ack_cells = self.ack_cells
+        format_timestamp = self.format_timestamp
         
         for sub_name, query in all_queries:
+            g = query.get
+            query_text = g('query_text', '')
+            paused = g('paused', False)
+            dead = g('dead', False)
+            
             # Format timestamps
-            last_check = query.get('last_check_time', 0)
-            next_check = query.get('next_check_time', 0)
-            last_file = query.get('last_file_time', 0)
+            last_check = g('last_check_time', 0)
+            next_check = g('next_check_time', 0)
+            last_file = g('last_file_time', 0)
             
-            last_check_str = "Never" if last_check == 0 else self.format_timestamp(last_check)
-            next_check_str = "Never" if next_check == 0 else self.format_timestamp(next_check)
-            last_file_str = "Never" if last_file == 0 else self.format_timestamp(last_file)
+            last_check_str = _NEVER if last_check == 0 else format_timestamp(last_check)
+            next_check_str = _NEVER if next_check == 0 else format_timestamp(next_check)
+            last_file_str = _NEVER if last_file == 0 else format_timestamp(last_file)
             
             # Format acknowledgment info
-            acknowledged = query.get('acknowledged', False)
-            ack_time = query.get('acknowledged_time', 0)
+            acknowledged = g('acknowledged', False)
+            ack_time = g('acknowledged_time', 0)
             
-            ack_str = "Yes" if acknowledged else "No"
-            if acknowledged and ack_time > 0:
-                if ack_time > now:
-                    ack_until_str = self.format_timestamp(ack_time)
-                else:
-                    ack_until_str = "Expired"
-            else:
-                ack_until_str = "N/A"
+            ack_str, ack_until_str = ack_cells(acknowledged, ack_time, now)
             
-            query_item = QTreeWidgetItem([
+            query_item = QueryItem([
                 sub_name,                                                       # Subscription
-                query.get('human_name', '') or query.get('query_text', ''),    # Human Name
-                query.get('query_text', ''),                                   # Query Text
+                g('human_name', '') or query_text,                             # Human Name
+                query_text,                                                    # Query Text
                 last_file_str,                                                 # Last File Time
                 ack_str,                                                       # Acknowledged
                 ack_until_str,                                                 # Ack Until
                 last_check_str,                                                # Last Check
                 next_check_str,                                                # Next Check
-                query.get('next_check_status', 'Unknown'),                     # Next Check Status
-                query.get('file_seed_cache_status', ''),                       # File Cache Status
-                "Yes" if query.get('paused', False) else "No",                # Paused
-                "Yes" if query.get('dead', False) else "No"                   # Dead
+                g('next_check_status', 'Unknown'),                             # Next Check Status
+                g('file_seed_cache_status', ''),                               # File Cache Status
+                _YESNO.get(paused, "No"),                                      # Paused
+                _YESNO.get(dead, "No")                                         # Dead
             ])
             
             # Store query ID for acknowledgment operations
-            query_id = query.get('id')
-            query_item.setData(0, Qt.ItemDataRole.UserRole + 1, query_id)
-            
-            # Store acknowledgment status for custom sorting (acknowledged items should always be at bottom)
-            sort_key = (1 if acknowledged else 0, last_file)  # Acknowledged=1 goes to bottom, then by last_file_time
-            query_item.setData(0, Qt.ItemDataRole.UserRole + 2, sort_key)
+            query_item.setData(0, Qt.ItemDataRole.UserRole + 1, g('id'))
             
-            # Debug: Also store in a tooltip for verification
-            query_item.setToolTip(0, f"Query ID: {query_id}, Ack: {acknowledged}")
-            
-            # Set raw timestamp data for proper sorting
-            query_item.setData(3, Qt.ItemDataRole.UserRole, last_file)   # Last File Time
-            query_item.setData(6, Qt.ItemDataRole.UserRole, last_check)  # Last Check
-            query_item.setData(7, Qt.ItemDataRole.UserRole, next_check)  # Next Check
-            
-            # Color code based on status and last file time
-            if acknowledged and (ack_time == 0 or ack_time > now):
-                # Acknowledged queries get green color
-                final_color = QColor(200, 255, 200)  # Light green
-            elif query.get('dead', False):
-                # Dead queries get red color
-                final_color = QColor(255, 200, 200)  # Light red
-            elif query.get('paused', False):
-                # Paused queries get gray color
-                final_color = QColor(230, 230, 230)  # Light gray
-            else:
-                # Active queries get orange gradient based on last file time
-                final_color = self.get_orange_color_for_age(last_file, min_time, max_time)
+            # Raw values for sorting; "Never" files sort after dated ones
+            query_item._raw = {
+                3: (last_file == 0, last_file),  # Last File Time
+                6: last_check,                   # Last Check
+                7: next_check                    # Next Check
+            }
+            query_item._ack = acknowledged
             
+            brush = row_brush(acknowledged, ack_time, dead, paused, last_file)
             for col in range(12):  # Updated to 12 columns
-                query_item.setBackground(col, final_color)
+                query_item.setBackground(col, brush)
             
-            self.subscription_tree.addTopLevelItem(query_item)
-            row_index += 1
+            items.append(query_item)
         
-        # Resize columns
-        for i in range(12):
-            self.subscription_tree.resizeColumnToContents(i)
+        # Insert all rows at once and lay out the view a single time
+        self.subscription_tree.setUpdatesEnabled(False)
+        try:
+            self.subscription_tree.addTopLevelItems(items)
+            
+            # Resize columns
+            for i in range(12):
+                self.subscription_tree.resizeColumnToContents(i)
+        finally:
+            self.subscription_tree.setUpdatesEnabled(True)
 
+    def store_data(self, data):
+        """Keep loaded subscription data for filtering and in-place acknowledgment updates"""
+        self.all_subscriptions_data = data.get('subscriptions', [])
+        self.all_queries = data.get('queries', [])
+        self.time_bounds = data.get('time_bounds', (0, 0))
+        self.queries_by_id = {query['id']: query for _, query in self.all_queries}
+    
+    def apply_acknowledgment(self, query_ids, acknowledged, acknowledged_time):
+        """Patch acknowledgment state of loaded queries and update their rows in place"""
+        for query_id in query_ids:
+            query = self.queries_by_id.get(query_id)
+            if query is not None:
+                query['acknowledged'] = acknowledged
+                query['acknowledged_time'] = acknowledged_time
+        
+        # Acknowledged queries are excluded from the color scale, so refresh its bounds
+        old_bounds = self.displayed_time_bounds()
+        self.time_bounds, sub_bounds = self.db_manager.load_time_bounds()
+        for sub in self.all_subscriptions_data:
+            sub['time_bounds'] = sub_bounds.get(sub['id'], (0, 0))
+        
+        if self.displayed_time_bounds() != old_bounds:
+            # The color scale moved, so every displayed row needs repainting
+            self.display_filtered_queries()
+            return
+        
+        now = int(datetime.datetime.now().timestamp())
+        row_brush = self.row_brush_factory(old_bounds, now)
+        ack_str, ack_until_str = self.ack_cells(acknowledged, acknowledged_time, now)
+        query_ids = set(query_ids)
+        
+        # Sorting is paused so the rows are re-sorted once, after all of them are updated
+        tree = self.subscription_tree
+        tree.setSortingEnabled(False)
+        for i in range(tree.topLevelItemCount()):
+            item = tree.topLevelItem(i)
+            query = self.queries_by_id.get(item.data(0, Qt.ItemDataRole.UserRole + 1))
+            if query is None or query['id'] not in query_ids:
+                continue
+            
+            item._ack = acknowledged
+            item.setText(4, ack_str)
+            item.setText(5, ack_until_str)
+            item.setToolTip(0, "")  # Rebuilt with the new state on the next hover
+            
+            brush = row_brush(acknowledged, acknowledged_time, query['dead'], query['paused'], query['last_file_time'])
+            for col in range(12):
+                item.setBackground(col, brush)
+        tree.setSortingEnabled(True)
+    
     def display_subscriptions(self, data):
         try:
             subscriptions = data.get('subscriptions', [])
             hydrus_version = data.get('hydrus_version', 'Unknown')
             
             # Store data for filtering
-            self.all_subscriptions_data = subscriptions
+            self.store_data(data)
             
             # Create subscription buttons
             self.create_subscription_buttons(subscriptions)
@@ -662,9 +853,7 @@ class MainWindow(QMainWindow):
     def format_timestamp(self, timestamp):
         """Convert Unix timestamp to readable format"""
         try:
-            import datetime
-            dt = datetime.datetime.fromtimestamp(timestamp)
-            return dt.strftime("%Y-%m-%d %H:%M")
+            return _format_ts(timestamp)
         except:
             return str(timestamp)
     
@@ -694,57 +883,78 @@ class MainWindow(QMainWindow):
         ack_days = int(self.ack_days_combo.currentText())
         ack_until_timestamp = int(datetime.datetime.now().timestamp()) + (ack_days * 24 * 3600)
         
-        conn = sqlite3.connect(self.db_manager.db_path)
-        cursor = conn.cursor()
+        # Log lines are collected and written to the text area in one append
+        log_lines = []
         
         try:
-            updated_count = 0
+            # Split the selection into rows known by id and rows matched by text
+            id_rows = []
+            text_rows = []
             for item in selected_items:
                 # Get query ID from the item data
                 query_id = item.data(0, Qt.ItemDataRole.UserRole + 1)
-                self.text_area.append(f"Processing item with query_id: {query_id}")
+                log_lines.append(f"Processing item with query_id: {query_id}")
                 
                 if query_id:
-                    cursor.execute(
-                        "UPDATE queries SET acknowledged = 1, acknowledged_time = ? WHERE id = ?",
-                        (ack_until_timestamp, query_id)
-                    )
-                    if cursor.rowcount > 0:
-                        updated_count += 1
-                        self.text_area.append(f"Updated query ID {query_id} in database")
-                    else:
-                        self.text_area.append(f"No rows updated for query ID {query_id}")
+                    id_rows.append((ack_until_timestamp, query_id))
                 else:
                     # Try to find query by matching text if ID not found
-                    query_text = item.text(2)  # Query Text column
-                    human_name = item.text(1)  # Human Name column
-                    subscription_name = item.text(0)  # Subscription column
+                    text_rows.append((
+                        item.text(2),  # Query Text column
+                        item.text(1),  # Human Name column
+                        item.text(0)   # Subscription column
+                    ))
+            
+            with self.db_manager.write_transaction() as cursor:
+                updated_count = 0
+                if id_rows:
+                    cursor.executemany(
+                        "UPDATE queries SET acknowledged = 1, acknowledged_time = ? WHERE id = ?",
+                        id_rows
+                    )
+                    updated_count += cursor.rowcount
+                if text_rows:
+                    # Resolve subscription names once rather than per row
+                    cursor.execute("SELECT name, id FROM subscriptions")
+                    name_to_id = dict(cursor.fetchall())
                     
+                    # Match every selected key with a single UPDATE
+                    cursor.execute("CREATE TEMP TABLE selected_keys (query_text TEXT, human_name TEXT, subscription_id INTEGER)")
+                    cursor.executemany(
+                        "INSERT INTO selected_keys (query_text, human_name, subscription_id) VALUES (?, ?, ?)",
+                        [(query_text, human_name, name_to_id.get(sub_name)) for query_text, human_name, sub_name in text_rows]
+                    )
                     cursor.execute('''
                         UPDATE queries SET acknowledged = 1, acknowledged_time = ? 
-                        WHERE query_text = ? AND human_name = ? 
-                        AND subscription_id = (SELECT id FROM subscriptions WHERE name = ?)
-                    ''', (ack_until_timestamp, query_text, human_name, subscription_name))
-                    
-                    if cursor.rowcount > 0:
-                        updated_count += 1
-                        self.text_area.append(f"Updated by text match: {query_text}")
+                        WHERE id IN (
+                            SELECT q.id FROM selected_keys k
+                            JOIN queries q ON q.subscription_id = k.subscription_id
+                            AND q.query_text = k.query_text AND q.human_name = k.human_name
+                        )
+                    ''', (ack_until_timestamp,))
+                    updated_count += cursor.rowcount
+                    cursor.execute("DROP TABLE temp.selected_keys")
             
-            conn.commit()
-            self.text_area.append(f"Successfully acknowledged {updated_count} queries for {ack_days} days")
+            if not updated_count:
+                # Nothing changed, so the loaded rows and the tree are still current
+                log_lines.append("No queries were acknowledged")
+                return
             
-            # Reload data from database and refresh display
-            data = self.db_manager.load_subscription_data()
-            self.all_subscriptions_data = data.get('subscriptions', [])
-            self.display_filtered_queries()
+            log_lines.append(f"Successfully acknowledged {updated_count} queries for {ack_days} days")
+            
+            # Patch the loaded rows in place; text-matched rows need a full reload
+            if text_rows:
+                self.store_data(self.db_manager.load_subscription_data())
+                self.display_filtered_queries()
+            else:
+                self.apply_acknowledgment([row[1] for row in id_rows], 1, ack_until_timestamp)
             
         except Exception as e:
-            conn.rollback()
-            self.text_area.append(f"Error acknowledging queries: {str(e)}")
+            log_lines.append(f"Error acknowledging queries: {str(e)}")
             import traceback
-            self.text_area.append(f"Traceback: {traceback.format_exc()}")
+            log_lines.append(f"Traceback: {traceback.format_exc()}")
         finally:
-            conn.close()
+            self.text_area.append("\n".join(log_lines))
     
     def unacknowledge_selected(self):
         """Unacknowledge selected queries"""
@@ -753,51 +963,72 @@ class MainWindow(QMainWindow):
             self.text_area.append("No items selected for unacknowledgment")
             return
         
-        conn = sqlite3.connect(self.db_manager.db_path)
-        cursor = conn.cursor()
-        
         try:
-            updated_count = 0
+            # Split the selection into rows known by id and rows matched by text
+            id_rows = []
+            text_rows = []
             for item in selected_items:
                 # Get query ID from the item data
                 query_id = item.data(0, Qt.ItemDataRole.UserRole + 1)
                 
                 if query_id:
-                    cursor.execute(
-                        "UPDATE queries SET acknowledged = 0, acknowledged_time = 0 WHERE id = ?",
-                        (query_id,)
-                    )
-                    updated_count += 1
+                    id_rows.append((query_id,))
                 else:
                     # Try to find query by matching text if ID not found
-                    query_text = item.text(2)  # Query Text column
-                    human_name = item.text(1)  # Human Name column
-                    subscription_name = item.text(0)  # Subscription column
+                    text_rows.append((
+                        item.text(2),  # Query Text column
+                        item.text(1),  # Human Name column
+                        item.text(0)   # Subscription column
+                    ))
+            
+            with self.db_manager.write_transaction() as cursor:
+                updated_count = 0
+                if id_rows:
+                    cursor.executemany(
+                        "UPDATE queries SET acknowledged = 0, acknowledged_time = 0 WHERE id = ?",
+                        id_rows
+                    )
+                    updated_count += cursor.rowcount
+                if text_rows:
+                    # Resolve subscription names once rather than per row
+                    cursor.execute("SELECT name, id FROM subscriptions")
+                    name_to_id = dict(cursor.fetchall())
                     
+                    # Match every selected key with a single UPDATE
+                    cursor.execute("CREATE TEMP TABLE selected_keys (query_text TEXT, human_name TEXT, subscription_id INTEGER)")
+                    cursor.executemany(
+                        "INSERT INTO selected_keys (query_text, human_name, subscription_id) VALUES (?, ?, ?)",
+                        [(query_text, human_name, name_to_id.get(sub_name)) for query_text, human_name, sub_name in text_rows]
+                    )
                     cursor.execute('''
                         UPDATE queries SET acknowledged = 0, acknowledged_time = 0 
-                        WHERE query_text = ? AND human_name = ? 
-                        AND subscription_id = (SELECT id FROM subscriptions WHERE name = ?)
-                    ''', (query_text, human_name, subscription_name))
-                    
-                    if cursor.rowcount > 0:
-                        updated_count += 1
+                        WHERE id IN (
+                            SELECT q.id FROM selected_keys k
+                            JOIN queries q ON q.subscription_id = k.subscription_id
+                            AND q.query_text = k.query_text AND q.human_name = k.human_name
+                        )
+                    ''')
+                    updated_count += cursor.rowcount
+                    cursor.execute("DROP TABLE temp.selected_keys")
+            
+            if not updated_count:
+                # Nothing changed, so the loaded rows and the tree are still current
+                self.text_area.append("No queries were unacknowledged")
+                return
             
-            conn.commit()
             self.text_area.append(f"Successfully unacknowledged {updated_count} queries")
             
-            # Reload data from database and refresh display
-            data = self.db_manager.load_subscription_data()
-            self.all_subscriptions_data = data.get('subscriptions', [])
-            self.display_filtered_queries()
+            # Patch the loaded rows in place; text-matched rows need a full reload
+            if text_rows:
+                self.store_data(self.db_manager.load_subscription_data())
+                self.display_filtered_queries()
+            else:
+                self.apply_acknowledgment([row[0] for row in id_rows], 0, 0)
             
         except Exception as e:
-            conn.rollback()
             self.text_area.append(f"Error unacknowledging queries: {str(e)}")
             import traceback
             self.text_area.append(f"Traceback: {traceback.format_exc()}")
-        finally:
-            conn.close()
 
 
     def on_selection_changed(self):
@@ -809,9 +1040,17 @@ class MainWindow(QMainWindow):
         self.ack_button.setEnabled(has_selection)
         self.unack_button.setEnabled(has_selection)
     
+    def on_item_entered(self, item, column):
+        """Set the debug tooltip for a row the first time the mouse enters it"""
+        if not item.toolTip(0):
+            query_id = item.data(0, Qt.ItemDataRole.UserRole + 1)
+            item.setToolTip(0, f"Query ID: {query_id}, Ack: {bool(item._ack)}")
+    
     def closeEvent(self, event):
         """Save window geometry when closing"""
         self.settings.setValue("geometry", self.saveGeometry())
+        self.db_manager.close()
+        self.http.close()
         super().closeEvent(event)
 
 def main():
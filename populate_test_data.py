@@ -3,20 +3,23 @@
 Test data population script for Hydrus Sub Monitor
 Uses the MVC database model for consistency
 """
-import sqlite3
 import json
 import datetime
 import random
 
 from src.models.database import DatabaseManager
 
+# Random data is generated in bulk: the velocity pool is serialized to JSON once,
+# each random column is drawn for all rows with one random.choices() call, and
+# flags/timestamps use random.random() directly, which is much cheaper per call
+# than choice()/randint()
+
 def add_20_new_queries_and_update_times():
     """Add 20 new queries and update all last file times with random values"""
     
-    # Use the MVC database manager
+    # Use the MVC database manager; writes go through its write_transaction(), so
+    # the PRAGMAs match the app's and closing the manager checkpoints the WAL
     db_manager = DatabaseManager()
-    conn = sqlite3.connect(db_manager.db_path)
-    cursor = conn.cursor()
     
     # Additional query templates for the new rows
     additional_queries = [
@@ -69,6 +72,7 @@ def add_20_new_queries_and_update_times():
         [[300, 172800], "300 files in previous 2 days"],
         [[5, 300], "5 files in previous 5 minutes"]
     ]
+    velocity_json = [json.dumps(v) for v in file_velocities]
     
     cache_statuses = [
         "45 successful, 2 ignored",
@@ -84,201 +88,222 @@ def add_20_new_queries_and_update_times():
     ]
     
     try:
-        # Get existing subscriptions to add queries to
-        cursor.execute("SELECT id FROM subscriptions")
-        subscription_ids = [row[0] for row in cursor.fetchall()]
-        
-        if not subscription_ids:
-            print("No subscriptions found. Run populate_test_data() first.")
-            return
-        
-        now = int(datetime.datetime.now().timestamp())
-        
-        # Add 20 new queries
-        print("Adding 20 new queries...")
-        for i in range(20):
-            query_data = additional_queries[i]
-            sub_id = random.choice(subscription_ids)
+        # One write transaction for the inserts and the updates
+        with db_manager.write_transaction() as cursor:
+            # Get existing subscriptions to add queries to
+            cursor.execute("SELECT id FROM subscriptions")
+            subscription_ids = [row[0] for row in cursor.fetchall()]
             
-            # Generate realistic timestamps
-            last_check = now - random.randint(3600, 86400 * 7)  # 1 hour to 7 days ago
-            next_check = now + random.randint(1800, 86400 * 2)  # 30 min to 2 days from now
+            if not subscription_ids:
+                print("No subscriptions found. Run populate_test_data() first.")
+                return
             
-            # Random status
-            is_paused = random.choice([True, False, False, False])  # 25% chance paused
-            is_dead = random.choice([True, False, False, False, False, False])  # ~17% chance dead
-            is_checking = random.choice([True, False, False, False, False])  # 20% chance checking
+            now_dt = datetime.datetime.now()
+            now = int(now_dt.timestamp())
+            rand = random.random
             
-            # Generate last file time
-            last_file_time = 0 if is_dead else random.randint(last_check, now)
+            # Add 20 new queries
+            print("Adding 20 new queries...")
+            new_rows = []
             
-            cursor.execute('''
+            sub_id_picks = random.choices(subscription_ids, k=20)
+            statuses = random.choices(status_messages, k=20)
+            checker_statuses = random.choices(range(4), k=20)
+            velocities = random.choices(velocity_json, k=20)
+            caches = random.choices(cache_statuses, k=20)
+            
+            for i in range(20):
+                query_data = additional_queries[i]
+                
+                # Generate realistic timestamps
+                last_check = now - 3600 - int(rand() * (86400 * 7 - 3600 + 1))  # 1 hour to 7 days ago
+                next_check = now + 1800 + int(rand() * (86400 * 2 - 1800 + 1))  # 30 min to 2 days from now
+                
+                # Random status
+                is_paused = rand() < 1 / 4  # 25% chance paused
+                is_dead = rand() < 1 / 6  # ~17% chance dead
+                is_checking = rand() < 1 / 5  # 20% chance checking
+                
+                # Generate last file time
+                last_file_time = 0 if is_dead else last_check + int(rand() * (now - last_check + 1))
+                
+                new_rows.append((
+                    sub_id_picks[i],
+                    query_data["query"],
+                    query_data["human"],
+                    None,
+                    0 if is_dead else last_check,
+                    0 if is_dead else next_check,
+                    statuses[i],
+                    is_paused,
+                    is_dead,
+                    is_checking,
+                    not is_dead,
+                    checker_statuses[i],
+                    velocities[i],
+                    caches[i],
+                    last_file_time,
+                    now_dt
+                ))
+            
+            cursor.executemany('''
                 INSERT INTO queries (
                     subscription_id, query_text, human_name, display_name,
                     last_check_time, next_check_time, next_check_status,
                     paused, dead, checking_now, can_check_now, checker_status,
                     file_velocity_data, file_seed_cache_status, last_file_time, updated_at
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                sub_id,
-                query_data["query"],
-                query_data["human"],
-                None,
-                0 if is_dead else last_check,
-                0 if is_dead else next_check,
-                random.choice(status_messages),
-                is_paused,
-                is_dead,
-                is_checking,
-                not is_dead,
-                random.randint(0, 3),
-                json.dumps(random.choice(file_velocities)),
-                random.choice(cache_statuses),
-                last_file_time,
-                datetime.datetime.now()
-            ))
-        
-        # Now update ALL queries with new random last file times
-        print("Updating all queries with new random last file times...")
-        cursor.execute("SELECT id, last_check_time, dead FROM queries")
-        all_queries = cursor.fetchall()
-        
-        for query_id, last_check_time, is_dead in all_queries:
-            if is_dead:
-                # Dead queries have no last file time
-                last_file_time = 0
-            else:
-                # Generate completely random last file time
-                if last_check_time and last_check_time > 0:
-                    # Random time between last check and now
-                    last_file_time = random.randint(last_check_time, now)
+            ''', new_rows)
+            
+            # Now update ALL queries with new random last file times
+            print("Updating all queries with new random last file times...")
+            cursor.execute("SELECT id, last_check_time, dead FROM queries")
+            all_queries = cursor.fetchall()
+            
+            update_rows = []
+            for query_id, last_check_time, is_dead in all_queries:
+                if is_dead:
+                    # Dead queries have no last file time
+                    last_file_time = 0
                 else:
-                    # Random recent time
-                    last_file_time = now - random.randint(3600, 86400 * 7)  # 1 hour to 7 days ago
+                    # Generate completely random last file time
+                    if last_check_time and last_check_time > 0:
+                        # Random time between last check and now
+                        last_file_time = last_check_time + int(rand() * (now - last_check_time + 1))
+                    else:
+                        # Random recent time
+                        last_file_time = now - 3600 - int(rand() * (86400 * 7 - 3600 + 1))  # 1 hour to 7 days ago
+                
+                update_rows.append((last_file_time, query_id))
             
-            cursor.execute(
+            cursor.executemany(
                 "UPDATE queries SET last_file_time = ? WHERE id = ?",
-                (last_file_time, query_id)
+                update_rows
             )
-        
-        conn.commit()
-        
-        # Show summary
-        cursor.execute("SELECT COUNT(*) FROM queries")
-        total_queries = cursor.fetchone()[0]
+            
+            # Show summary
+            cursor.execute("SELECT COUNT(*) FROM queries")
+            total_queries = cursor.fetchone()[0]
         
         print(f"Successfully added 20 new queries!")
         print(f"Updated all {total_queries} queries with random last file times!")
         
     except Exception as e:
-        conn.rollback()
         print(f"Error adding queries and updating times: {e}")
     finally:
-        conn.close()
+        db_manager.close()
 
-def update_last_file_times():
-    """Update existing queries with last file times without adding new items"""
+def update_last_file_times(verbose=False):
+    """Update existing queries with last file times without adding new items (per-query output only if verbose)"""
     
-    # Use the MVC database manager
+    # Use the MVC database manager; writes go through its write_transaction(), so
+    # the PRAGMAs match the app's and closing the manager checkpoints the WAL
     db_manager = DatabaseManager()
-    conn = sqlite3.connect(db_manager.db_path)
-    cursor = conn.cursor()
     
     try:
-        # Get all existing queries
-        cursor.execute("SELECT id, last_check_time, dead FROM queries")
-        queries = cursor.fetchall()
-        
-        if not queries:
-            print("No existing queries found. Run populate_test_data() first.")
-            return
-        
-        now = int(datetime.datetime.now().timestamp())
-        updated_count = 0
-        
-        for query_id, last_check_time, is_dead in queries:
-            if is_dead:
-                # Dead queries have no last file time
-                last_file_time = 0
-                print(f"Query {query_id}: Dead - setting last_file_time to 0")
-            else:
-                # Generate realistic last file time
-                if last_check_time and last_check_time > 0:
-                    # Random time between last check and now
-                    last_file_time = random.randint(last_check_time, now)
-                    print(f"Query {query_id}: Active - setting last_file_time to {last_file_time} (between {last_check_time} and {now})")
-                else:
-                    # If no last check time, generate something recent
-                    last_file_time = now - random.randint(3600, 86400 * 7)  # 1 hour to 7 days ago
-                    print(f"Query {query_id}: No last_check - setting last_file_time to {last_file_time}")
+        # One write transaction for all the updates
+        with db_manager.write_transaction() as cursor:
+            now = int(datetime.datetime.now().timestamp())
+            rand = random.random
             
-            cursor.execute(
-                "UPDATE queries SET last_file_time = ? WHERE id = ?",
-                (last_file_time, query_id)
-            )
-            updated_count += 1
+            def new_file_times():
+                """Yield (id, last_file_time) for every query, reading the table in chunks"""
+                read_cursor = cursor.connection.execute("SELECT id, last_check_time, dead FROM queries")
+                while True:
+                    batch = read_cursor.fetchmany(10000)
+                    if not batch:
+                        return
+                    for query_id, last_check_time, is_dead in batch:
+                        if is_dead:
+                            # Dead queries have no last file time
+                            last_file_time = 0
+                            if verbose:
+                                print(f"Query {query_id}: Dead - setting last_file_time to 0")
+                        else:
+                            # Generate realistic last file time
+                            if last_check_time and last_check_time > 0:
+                                # Random time between last check and now
+                                last_file_time = last_check_time + int(rand() * (now - last_check_time + 1))
+                                if verbose:
+                                    print(f"Query {query_id}: Active - setting last_file_time to {last_file_time} (between {last_check_time} and {now})")
+                            else:
+                                # If no last check time, generate something recent
+                                last_file_time = now - 3600 - int(rand() * (86400 * 7 - 3600 + 1))  # 1 hour to 7 days ago
+                                if verbose:
+                                    print(f"Query {query_id}: No last_check - setting last_file_time to {last_file_time}")
+                        
+                        yield query_id, last_file_time
+            
+            # Stage the new values and apply them with a single UPDATE
+            cursor.execute("CREATE TEMP TABLE new_file_times (id INTEGER PRIMARY KEY, last_file_time INTEGER)")
+            cursor.executemany("INSERT INTO new_file_times (id, last_file_time) VALUES (?, ?)", new_file_times())
+            if not cursor.rowcount:
+                cursor.execute("DROP TABLE temp.new_file_times")
+                print("No existing queries found. Run populate_test_data() first.")
+                return
+            cursor.execute('''
+                UPDATE queries
+                SET last_file_time = (SELECT n.last_file_time FROM new_file_times n WHERE n.id = queries.id)
+                WHERE id IN (SELECT id FROM new_file_times)
+            ''')
+            updated_count = cursor.rowcount
+            cursor.execute("DROP TABLE temp.new_file_times")
+            
+            # Verify the updates
+            cursor.execute("SELECT COUNT(*) FROM queries WHERE last_file_time > 0")
+            non_zero_count = cursor.fetchone()[0]
         
-        conn.commit()
         print(f"Successfully updated {updated_count} queries with last file times!")
-        
-        # Verify the updates
-        cursor.execute("SELECT COUNT(*) FROM queries WHERE last_file_time > 0")
-        non_zero_count = cursor.fetchone()[0]
         print(f"Queries with non-zero last_file_time: {non_zero_count}")
         
     except Exception as e:
-        conn.rollback()
         print(f"Error updating last file times: {e}")
     finally:
-        conn.close()
+        db_manager.close()
 
 def populate_test_data():
     """Populate the database with test subscription data"""
     
-    # Use the MVC database manager
+    # Use the MVC database manager; writes go through its write_transaction(), so
+    # the PRAGMAs match the app's and closing the manager checkpoints the WAL
     db_manager = DatabaseManager()
-    conn = sqlite3.connect(db_manager.db_path)
-    cursor = conn.cursor()
     
     # Create tables if they don't exist
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS subscriptions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            gug_name TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS queries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            subscription_id INTEGER,
-            query_text TEXT NOT NULL,
-            human_name TEXT,
-            display_name TEXT,
-            last_check_time INTEGER,
-            next_check_time INTEGER,
-            next_check_status TEXT,
-            paused BOOLEAN,
-            dead BOOLEAN,
-            checking_now BOOLEAN,
-            can_check_now BOOLEAN,
-            checker_status INTEGER,
-            file_velocity_data TEXT,
-            file_seed_cache_status TEXT,
-            last_file_time INTEGER,
-            acknowledged BOOLEAN DEFAULT 0,
-            acknowledged_time INTEGER DEFAULT 0,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (subscription_id) REFERENCES subscriptions (id)
-        )
-    ''')
-    
-    # Clear existing data
-    cursor.execute("DELETE FROM queries")
-    cursor.execute("DELETE FROM subscriptions")
+    with db_manager.write_transaction() as cursor:
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS subscriptions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                gug_name TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS queries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                subscription_id INTEGER,
+                query_text TEXT NOT NULL,
+                human_name TEXT,
+                display_name TEXT,
+                last_check_time INTEGER,
+                next_check_time INTEGER,
+                next_check_status TEXT,
+                paused BOOLEAN,
+                dead BOOLEAN,
+                checking_now BOOLEAN,
+                can_check_now BOOLEAN,
+                checker_status INTEGER,
+                file_velocity_data TEXT,
+                file_seed_cache_status TEXT,
+                last_file_time INTEGER,
+                acknowledged BOOLEAN DEFAULT 0,
+                acknowledged_time INTEGER DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (subscription_id) REFERENCES subscriptions (id)
+            )
+        ''')
     
     # Test subscription data - exactly 4 subscriptions
     subscriptions_data = [
@@ -343,6 +368,7 @@ def populate_test_data():
         [[300, 172800], "300 files in previous 2 days"],
         [[5, 300], "5 files in previous 5 minutes"]
     ]
+    velocity_json = [json.dumps(v) for v in file_velocities]
     
     cache_statuses = [
         "45 successful, 2 ignored",
@@ -357,94 +383,98 @@ def populate_test_data():
         ""
     ]
     
-    now = int(datetime.datetime.now().timestamp())
+    now_dt = datetime.datetime.now()
+    now = int(now_dt.timestamp())
+    rand = random.random
     
     try:
-        # Insert subscriptions and their queries
-        for i, sub_data in enumerate(subscriptions_data):
-            # Insert subscription
-            cursor.execute('''
-                INSERT INTO subscriptions (name, gug_name, updated_at)
-                VALUES (?, ?, ?)
-            ''', (
-                sub_data["name"],
-                sub_data["gug_name"],
-                datetime.datetime.now()
-            ))
+        # Clear and repopulate in a single write transaction
+        with db_manager.write_transaction() as cursor:
+            # Clear existing data
+            cursor.execute("DELETE FROM queries")
+            cursor.execute("DELETE FROM subscriptions")
             
-            sub_id = cursor.lastrowid
-            
-            # Add exactly 5 queries per subscription
-            num_queries = 5
-            used_queries = set()
-            
-            for j in range(num_queries):
-                # Pick a unique query for this subscription
-                while True:
-                    query_template = random.choice(query_templates)
-                    if query_template["query"] not in used_queries:
-                        used_queries.add(query_template["query"])
-                        break
+            # Insert subscriptions and collect their queries
+            query_rows = []
+            for i, sub_data in enumerate(subscriptions_data):
+                # Insert subscription
+                cursor.execute('''
+                    INSERT INTO subscriptions (name, gug_name, updated_at)
+                    VALUES (?, ?, ?)
+                ''', (
+                    sub_data["name"],
+                    sub_data["gug_name"],
+                    now_dt
+                ))
                 
-                # Generate realistic timestamps
-                last_check = now - random.randint(3600, 86400 * 7)  # 1 hour to 7 days ago
-                next_check = now + random.randint(1800, 86400 * 2)  # 30 min to 2 days from now
+                sub_id = cursor.lastrowid
                 
-                # Random status
-                is_paused = random.choice([True, False, False, False])  # 25% chance paused
-                is_dead = random.choice([True, False, False, False, False, False])  # ~17% chance dead
-                is_checking = random.choice([True, False, False, False, False])  # 20% chance checking
+                # Add exactly 5 queries per subscription
+                num_queries = 5
                 
-                # Generate last file time (some time between last check and now)
-                last_file_time = 0 if is_dead else random.randint(last_check, now)
+                statuses = random.choices(status_messages, k=num_queries)
+                checker_statuses = random.choices(range(4), k=num_queries)
+                velocities = random.choices(velocity_json, k=num_queries)
+                caches = random.choices(cache_statuses, k=num_queries)
                 
-                cursor.execute('''
-                    INSERT INTO queries (
-                        subscription_id, query_text, human_name, display_name,
-                        last_check_time, next_check_time, next_check_status,
-                        paused, dead, checking_now, can_check_now, checker_status,
-                        file_velocity_data, file_seed_cache_status, last_file_time,
-                        acknowledged, acknowledged_time, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    sub_id,
-                    query_template["query"],
-                    query_template["human"],
-                    None,
-                    0 if is_dead else last_check,
-                    0 if is_dead else next_check,
-                    random.choice(status_messages),
-                    is_paused,
-                    is_dead,
-                    is_checking,
-                    not is_dead,
-                    random.randint(0, 3),
-                    json.dumps(random.choice(file_velocities)),
-                    random.choice(cache_statuses),
-                    last_file_time,
-                    False,  # acknowledged
-                    0,      # acknowledged_time
-                    datetime.datetime.now()
-                ))
+                # Pick unique queries for this subscription
+                for j, query_template in enumerate(random.sample(query_templates, num_queries)):
+                    # Generate realistic timestamps
+                    last_check = now - 3600 - int(rand() * (86400 * 7 - 3600 + 1))  # 1 hour to 7 days ago
+                    next_check = now + 1800 + int(rand() * (86400 * 2 - 1800 + 1))  # 30 min to 2 days from now
+                    
+                    # Random status
+                    is_paused = rand() < 1 / 4  # 25% chance paused
+                    is_dead = rand() < 1 / 6  # ~17% chance dead
+                    is_checking = rand() < 1 / 5  # 20% chance checking
+                    
+                    # Generate last file time (some time between last check and now)
+                    last_file_time = 0 if is_dead else last_check + int(rand() * (now - last_check + 1))
+                    
+                    query_rows.append((
+                        sub_id,
+                        query_template["query"],
+                        query_template["human"],
+                        None,
+                        0 if is_dead else last_check,
+                        0 if is_dead else next_check,
+                        statuses[j],
+                        is_paused,
+                        is_dead,
+                        is_checking,
+                        not is_dead,
+                        checker_statuses[j],
+                        velocities[j],
+                        caches[j],
+                        last_file_time,
+                        False,  # acknowledged
+                        0,      # acknowledged_time
+                        now_dt
+                    ))
+            
+            cursor.executemany('''
+                INSERT INTO queries (
+                    subscription_id, query_text, human_name, display_name,
+                    last_check_time, next_check_time, next_check_status,
+                    paused, dead, checking_now, can_check_now, checker_status,
+                    file_velocity_data, file_seed_cache_status, last_file_time,
+                    acknowledged, acknowledged_time, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', query_rows)
+            
+            # Show summary
+            cursor.execute("SELECT (SELECT COUNT(*) FROM subscriptions), (SELECT COUNT(*) FROM queries)")
+            sub_count, query_count = cursor.fetchone()
         
-        conn.commit()
         print(f"Successfully populated database with {len(subscriptions_data)} subscriptions and their queries!")
-        
-        # Show summary
-        cursor.execute("SELECT COUNT(*) FROM subscriptions")
-        sub_count = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM queries")
-        query_count = cursor.fetchone()[0]
-        
         print(f"Database now contains:")
         print(f"  - {sub_count} subscriptions")
         print(f"  - {query_count} queries")
         
     except Exception as e:
-        conn.rollback()
         print(f"Error populating database: {e}")
     finally:
-        conn.close()
+        db_manager.close()
 
 if __name__ == "__main__":
     print("Clearing database and creating fresh test data...")
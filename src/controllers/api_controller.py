@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
+import json
+import logging
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from PyQt6.QtCore import QThread, pyqtSignal
 from typing import Dict, Any, Optional
 from ..models.database import DatabaseManager
 from ..models.config import ApiConfig
 from ..utils.logger import logger
-from ..utils.validators import validate_api_key, validate_url
+
+
+# Minimum seconds between repeats of the same progress message; a new stage always emits
+_PROGRESS_INTERVAL = 0.05
 
 
 class ApiController(QThread):
@@ -19,85 +26,103 @@ class ApiController(QThread):
         super().__init__()
         self.db_manager = db_manager
         self.api_config = api_config
+        self._last_progress = 0.0
+        self._last_progress_message = None
         self._validate_config()
+        
+        # One keep-alive session so the version probe and the fetch share a connection
+        self.session = requests.Session()
+        self.session.headers["Hydrus-Client-API-Access-Key"] = self.api_config.api_key
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    
+    def _progress(self, message: str) -> None:
+        """Emit a progress update, dropping repeats that follow too closely on the last"""
+        now = time.monotonic()
+        if message != self._last_progress_message or now - self._last_progress > _PROGRESS_INTERVAL:
+            self._last_progress = now
+            self._last_progress_message = message
+            self.progress_updated.emit(message)
+    
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections"""
+        self.session.close()
     
     def _validate_config(self) -> None:
         """Validate API configuration"""
-        valid, error = validate_api_key(self.api_config.api_key)
-        if not valid:
-            logger.error(f"Invalid API key: {error}")
-        
-        valid, error = validate_url(self.api_config.base_url)
-        if not valid:
-            logger.error(f"Invalid base URL: {error}")
+        # ApiConfig validates itself when built or edited; only report here
+        for error in self.api_config.validation_errors:
+            logger.error(error)
     
     def run(self) -> None:
         """Fetch subscription data from Hydrus API"""
         logger.info("Starting API data fetch")
-        self.progress_updated.emit("Connecting to Hydrus API...")
+        self._progress("Connecting to Hydrus API...")
         
         try:
-            headers = {"Hydrus-Client-API-Access-Key": self.api_config.api_key}
-            api_url = f"{self.api_config.base_url}/manage_subscriptions/get_subscriptions"
+            api_url = self.api_config.subscriptions_url
             
-            logger.info(f"API URL: {api_url}")
-            logger.info(f"API Key: {self.api_config.api_key[:8]}...{self.api_config.api_key[-8:]}")
-            logger.info(f"Timeout: {self.api_config.timeout}s")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"API URL: {api_url}")
+                logger.info(f"API Key: {self.api_config.api_key[:8]}...{self.api_config.api_key[-8:]}")
+                logger.info(f"Timeout: {self.api_config.timeout}s")
             
-            self.progress_updated.emit("Fetching subscription data...")
+            self._progress("Fetching subscription data...")
             logger.info("Sending GET request to Hydrus API...")
             
-            response = requests.get(
+            response = self.session.get(
                 api_url, 
-                headers=headers, 
                 timeout=self.api_config.timeout
             )
             
             logger.info(f"Response status code: {response.status_code}")
-            logger.info(f"Response headers: {dict(response.headers)}")
+            logger.debug("Response headers: %s", response.headers)
             
-            if response.text:
-                logger.info(f"Response content length: {len(response.text)} characters")
-                if len(response.text) < 500:  # Log short responses completely
-                    logger.info(f"Response content: {response.text}")
+            # Work on the raw body; only the logged prefix is ever decoded
+            raw = response.content
+            if raw and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Response content length: {len(raw)} bytes")
+                if len(raw) < 500:  # Log short responses completely
+                    logger.debug(f"Response content: {raw.decode('utf-8', 'replace')}")
                 else:
-                    logger.info(f"Response content (first 200 chars): {response.text[:200]}...")
+                    logger.debug(f"Response content (first 200 bytes): {raw[:200].decode('utf-8', 'replace')}...")
             
             if response.status_code == 200:
-                self.progress_updated.emit("Processing response data...")
+                self._progress("Processing response data...")
                 logger.info("Successfully received 200 response, parsing JSON...")
                 
                 try:
-                    data = response.json()
-                    logger.info(f"JSON parsed successfully. Keys: {list(data.keys())}")
-                    
-                    if 'subscriptions' in data:
-                        sub_count = len(data['subscriptions'])
-                        logger.info(f"Found {sub_count} subscriptions in response")
-                        
-                        # Log first subscription for debugging
-                        if sub_count > 0:
-                            first_sub = data['subscriptions'][0]
-                            logger.info(f"First subscription: {first_sub.get('name', 'Unknown')} with {len(first_sub.get('queries', []))} queries")
-                    
+                    # Parse the body bytes directly, skipping the decode to str
+                    data = json.loads(raw)
                 except Exception as json_error:
                     logger.error(f"Failed to parse JSON response: {str(json_error)}")
                     self.error_occurred.emit(f"Invalid JSON response: {str(json_error)}")
                     return
                 
-                # Validate response structure
+                # Validate response structure before walking it for the log
                 if not self._validate_response(data):
                     logger.error("Response validation failed")
                     self.error_occurred.emit("Invalid response format from API")
                     return
                 
-                self.progress_updated.emit("Saving to database...")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"JSON parsed successfully. Keys: {list(data.keys())}")
+                    sub_count = len(data['subscriptions'])
+                    logger.info(f"Found {sub_count} subscriptions in response")
+                    
+                    # Log first subscription for debugging
+                    if sub_count > 0:
+                        first_sub = data['subscriptions'][0]
+                        logger.info(f"First subscription: {first_sub.get('name', 'Unknown')} with {len(first_sub.get('queries', []))} queries")
+                
+                self._progress("Saving to database...")
                 logger.info("Attempting to save data to database...")
                 
                 # Save to database
                 if self.db_manager.save_subscription_data(data):
-                    total_queries = sum(len(sub.get('queries', [])) for sub in data.get('subscriptions', []))
-                    logger.info(f"Successfully saved {len(data.get('subscriptions', []))} subscriptions with {total_queries} total queries to database")
+                    if logger.isEnabledFor(logging.INFO):
+                        total_queries = sum(len(sub.get('queries', [])) for sub in data['subscriptions'])
+                        logger.info(f"Successfully saved {len(data['subscriptions'])} subscriptions with {total_queries} total queries to database")
                     self.data_received.emit(data)
                 else:
                     logger.error("Database save operation failed")
@@ -137,30 +162,23 @@ class ApiController(QThread):
     
     def _validate_response(self, data: Dict[str, Any]) -> bool:
         """Validate API response structure"""
-        if not isinstance(data, dict):
-            return False
-        
-        if 'subscriptions' not in data:
-            return False
-        
-        if not isinstance(data['subscriptions'], list):
-            return False
-        
-        return True
+        # Only the top-level shape is checked, nothing below it is walked
+        return isinstance(data, dict) and isinstance(data.get('subscriptions'), list)
     
     def test_connection(self) -> tuple[bool, Optional[str]]:
         """Test if the API connection is working"""
         try:
-            headers = {"Hydrus-Client-API-Access-Key": self.api_config.api_key}
-            test_url = f"{self.api_config.base_url}/api_version"
+            test_url = self.api_config.api_version_url
             
-            logger.info(f"Testing connection to: {test_url}")
-            logger.info(f"Using API key: {self.api_config.api_key[:8]}...{self.api_config.api_key[-8:]}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Testing connection to: {test_url}")
+                logger.info(f"Using API key: {self.api_config.api_key[:8]}...{self.api_config.api_key[-8:]}")
             
-            response = requests.get(test_url, headers=headers, timeout=5)
+            response = self.session.get(test_url, timeout=5)
             
-            logger.info(f"Test connection response: {response.status_code}")
-            logger.info(f"Test response content: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Test connection response: {response.status_code}")
+                logger.info(f"Test response content: {response.text}")
             
             if response.status_code == 200:
                 return True, None
@@ -10,6 +10,15 @@ from ..utils.logger import logger
 from .api_controller import ApiController
 
 
+# Item data role holding the query ID (Qt.ItemDataRole.UserRole + 1)
+_QID_ROLE = 257
+
+# Query tree columns read by the text fallback
+_COL_SUB = 0
+_COL_HUMAN = 1
+_COL_QUERY = 2
+
+
 class MainController:
     """Main controller coordinating between models and views"""
     
@@ -24,30 +33,44 @@ class MainController:
         self.current_filter: Optional[str] = None
         self.api_controller: Optional[ApiController] = None
         
+        # Filtered view caches, cleared whenever the data or the filter changes
+        self._filtered_cache: Optional[List] = None
+        self._sorted_cache: Optional[List[tuple[str, Query]]] = None
+        
         logger.info("Main controller initialized")
     
+    def _invalidate_view_cache(self) -> None:
+        """Drop the cached filtered subscriptions and sorted queries"""
+        self._filtered_cache = None
+        self._sorted_cache = None
+    
     def load_from_database(self) -> SubscriptionData:
         """Load subscription data from database"""
         logger.info("Loading subscription data from database")
         try:
-            data_dict = self.db_manager.load_subscription_data()
-            self.subscription_data = SubscriptionData.from_dict(data_dict)
+            self.subscription_data = self.db_manager.load_subscriptions()
+            self._invalidate_view_cache()
             logger.info(f"Loaded {len(self.subscription_data.subscriptions)} subscriptions")
             return self.subscription_data
         except Exception as e:
             logger.error(f"Failed to load from database: {str(e)}")
             # Return empty data on error
             self.subscription_data = SubscriptionData([], 0, "Database Error")
+            self._invalidate_view_cache()
             return self.subscription_data
     
     def create_api_controller(self) -> ApiController:
         """Create and return API controller"""
+        if self.api_controller:
+            # The previous fetch has finished; release its pooled connection
+            self.api_controller.close()
         self.api_controller = ApiController(self.db_manager, self.config.api)
         return self.api_controller
     
     def set_subscription_data(self, data_dict: dict) -> None:
         """Set subscription data from API response"""
         self.subscription_data = SubscriptionData.from_dict(data_dict)
+        self._invalidate_view_cache()
     
     def create_api_backup(self) -> str:
         """Create a backup before API update"""
@@ -74,93 +97,68 @@ class MainController:
         if not self.subscription_data:
             return []
         
-        if self.current_filter:
-            filtered_sub = self.subscription_data.get_subscription_by_name(self.current_filter)
-            return [filtered_sub] if filtered_sub else []
-        
-        return self.subscription_data.subscriptions
+        if self._filtered_cache is None:
+            if self.current_filter:
+                filtered_sub = self.subscription_data.get_subscription_by_name(self.current_filter)
+                self._filtered_cache = [filtered_sub] if filtered_sub else []
+            else:
+                self._filtered_cache = self.subscription_data.subscriptions
+        return self._filtered_cache
     
     def set_filter(self, subscription_name: Optional[str]) -> None:
         """Set the current subscription filter"""
         self.current_filter = subscription_name
+        self._invalidate_view_cache()
     
     def get_all_queries_sorted(self) -> List[tuple[str, Query]]:
         """Get all queries sorted by priority"""
         if not self.subscription_data:
             return []
         
-        subscriptions_to_show = self.get_filtered_subscriptions()
-        all_queries = []
+        if self._sorted_cache is not None:
+            return self._sorted_cache
         
-        for sub in subscriptions_to_show:
-            for query in sub.queries:
-                all_queries.append((sub.name, query))
+        all_queries = [(sub.name, query)
+                       for sub in self.get_filtered_subscriptions()
+                       for query in sub.queries]
         
         # Sort queries with three tiers:
         # 1. Normal queries (have last_file_time > 0) - sorted by last_file_time (oldest first)
         # 2. "Never" queries (last_file_time = 0) - at bottom but above acknowledged
         # 3. Acknowledged queries - at very bottom
-        def sort_key(item):
-            query = item[1]
-            acknowledged = query.acknowledged
-            last_file_time = query.last_file_time
-            
-            if acknowledged:
-                return (2, last_file_time)  # Tier 2: Acknowledged (very bottom)
-            elif last_file_time == 0:
-                return (1, 0)  # Tier 1: Never files (bottom but above acknowledged)
-            else:
-                return (0, last_file_time)  # Tier 0: Normal files (top, oldest first)
-        
-        all_queries.sort(key=sort_key)
+        # Each Query packs its tier into sort_key, computed on first use
+        all_queries.sort(key=lambda item: item[1].sort_key)
+        self._sorted_cache = all_queries
         return all_queries
     
     def acknowledge_queries(self, selected_items: List[QTreeWidgetItem], ack_days: int) -> int:
         """Acknowledge selected queries for specified number of days"""
         ack_until_timestamp = int(datetime.datetime.now().timestamp()) + (ack_days * 24 * 3600)
-        updated_count = 0
-        
-        for item in selected_items:
-            # Get query ID from the item data
-            query_id = item.data(0, 257)  # Qt.ItemDataRole.UserRole + 1
-            
-            if query_id:
-                if self.db_manager.update_query_acknowledgment(query_id, True, ack_until_timestamp):
-                    updated_count += 1
-            else:
-                # Try to find query by matching text if ID not found
-                query_text = item.text(2)  # Query Text column
-                human_name = item.text(1)  # Human Name column
-                subscription_name = item.text(0)  # Subscription column
-                
-                if self.db_manager.update_queries_by_text(
-                    query_text, human_name, subscription_name, True, ack_until_timestamp
-                ):
-                    updated_count += 1
-        
-        return updated_count
+        return self._set_acknowledgment(selected_items, True, ack_until_timestamp)
     
     def unacknowledge_queries(self, selected_items: List[QTreeWidgetItem]) -> int:
         """Unacknowledge selected queries"""
-        updated_count = 0
-        
+        return self._set_acknowledgment(selected_items, False, 0)
+    
+    def _set_acknowledgment(self, selected_items: List[QTreeWidgetItem], acknowledged: bool, ack_time: int) -> int:
+        """Write acknowledgment state for the selected items in two batched updates"""
+        query_ids = []
+        fallback_keys = []
         for item in selected_items:
             # Get query ID from the item data
-            query_id = item.data(0, 257)  # Qt.ItemDataRole.UserRole + 1
-            
+            query_id = item.data(0, _QID_ROLE)
             if query_id:
-                if self.db_manager.update_query_acknowledgment(query_id, False, 0):
-                    updated_count += 1
+                query_ids.append(query_id)
             else:
-                # Try to find query by matching text if ID not found
-                query_text = item.text(2)  # Query Text column
-                human_name = item.text(1)  # Human Name column
-                subscription_name = item.text(0)  # Subscription column
-                
-                if self.db_manager.update_queries_by_text(
-                    query_text, human_name, subscription_name, False, 0
-                ):
-                    updated_count += 1
+                # Read the match key off the item once, then work on plain strings
+                fallback_keys.append((item.text(_COL_QUERY), item.text(_COL_HUMAN), item.text(_COL_SUB)))
+        
+        updated_count = 0
+        if query_ids:
+            updated_count += self.db_manager.update_query_acknowledgments_bulk(query_ids, acknowledged, ack_time)
+        if fallback_keys:
+            # Try to find queries by matching text if ID not found
+            updated_count += self.db_manager.update_queries_by_text_bulk(fallback_keys, acknowledged, ack_time)
         
         return updated_count
     
@@ -174,8 +172,13 @@ class MainController:
     
     def get_filtered_query_count(self) -> int:
         """Get number of queries in current filter"""
-        subscriptions = self.get_filtered_subscriptions()
-        return sum(sub.query_count for sub in subscriptions)
+        if not self.current_filter:
+            return self.get_total_queries()
+        
+        if not self.subscription_data:
+            return 0
+        sub = self.subscription_data.get_subscription_by_name(self.current_filter)
+        return sub.query_count if sub else 0
     
     def get_backup_files(self) -> List[Dict[str, Any]]:
         """Get list of available backup files"""
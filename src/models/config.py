@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 """Configuration management for Hydrus Sub Monitor"""
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
+from typing import Dict, Any, List, Optional
+import base64
 import json
 import os
 from pathlib import Path
 
+from ..utils.validators import validate_api_key, validate_url
+
 
 @dataclass
 class ApiConfig:
@@ -14,6 +18,40 @@ class ApiConfig:
     base_url: str = "http://127.0.0.1:45869"
     timeout: int = 10
     enabled: bool = True  # Enabled by default
+    
+    def __post_init__(self):
+        # Validate once up front; results are cached until the key or URL changes
+        self.validation_errors
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ('api_key', 'base_url'):
+            # Drop the cached values derived from the old settings
+            for derived in ('validation_errors', 'subscriptions_url', 'api_version_url'):
+                self.__dict__.pop(derived, None)
+    
+    @cached_property
+    def validation_errors(self) -> List[str]:
+        """Get problems with the API key and base URL"""
+        errors = []
+        valid, error = validate_api_key(self.api_key)
+        if not valid:
+            errors.append(f"Invalid API key: {error}")
+        
+        valid, error = validate_url(self.base_url)
+        if not valid:
+            errors.append(f"Invalid base URL: {error}")
+        return errors
+    
+    @cached_property
+    def subscriptions_url(self) -> str:
+        """Get the full subscriptions API URL"""
+        return f"{self.base_url}/manage_subscriptions/get_subscriptions"
+    
+    @cached_property
+    def api_version_url(self) -> str:
+        """Get the API version URL used to test the connection"""
+        return f"{self.base_url}/api_version"
 
 
 @dataclass
@@ -50,39 +88,35 @@ class AppConfig:
             return config
         
         try:
-            with open(config_path, 'r') as f:
-                data = json.load(f)
-            
-            return cls(
-                api=ApiConfig(**data.get('api', {})),
-                database=DatabaseConfig(**data.get('database', {})),
-                ui=UIConfig(**data.get('ui', {}))
-            )
+            with open(config_path, 'rb') as f:
+                return cls.from_bytes(f.read())
         except Exception:
             # Return default config if loading fails
             return cls()
     
+    @classmethod
+    def from_bytes(cls, buf: bytes) -> 'AppConfig':
+        """Create configuration from raw JSON config file contents"""
+        data = json.loads(buf)
+        
+        ui = data.get('ui', {})
+        if ui.get('window_geometry'):
+            ui['window_geometry'] = base64.b64decode(ui['window_geometry'])
+        
+        return cls(
+            api=ApiConfig(**data.get('api', {})),
+            database=DatabaseConfig(**data.get('database', {})),
+            ui=UIConfig(**ui)
+        )
+    
     def save_to_file(self, config_path: str = "config.json") -> bool:
         """Save configuration to JSON file"""
         try:
-            data = {
-                'api': {
-                    'api_key': self.api.api_key,
-                    'base_url': self.api.base_url,
-                    'timeout': self.api.timeout,
-                    'enabled': self.api.enabled
-                },
-                'database': {
-                    'db_path': self.database.db_path,
-                    'backup_enabled': self.database.backup_enabled,
-                    'backup_count': self.database.backup_count
-                },
-                'ui': {
-                    'default_ack_days': self.ui.default_ack_days,
-                    'auto_refresh_interval': self.ui.auto_refresh_interval,
-                    'column_widths': self.ui.column_widths
-                }
-            }
+            data = asdict(self)
+            # Geometry is raw bytes, which JSON cannot hold, so it is stored as base64
+            geometry = data['ui'].pop('window_geometry')
+            if geometry is not None:
+                data['ui']['window_geometry'] = base64.b64encode(geometry).decode('ascii')
             
             with open(config_path, 'w') as f:
                 json.dump(data, f, indent=2)
@@ -93,4 +127,4 @@ class AppConfig:
     @property
     def subscriptions_api_url(self) -> str:
         """Get the full subscriptions API URL"""
-        return f"{self.api.base_url}/manage_subscriptions/get_subscriptions"
\ No newline at end of file
+        return self.api.subscriptions_url
\ No newline at end of file
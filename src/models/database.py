@@ -2,14 +2,75 @@
 import sqlite3
 import json
 import datetime
-import shutil
 import os
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 
+from .subscription import Query, Subscription, SubscriptionData
 from ..utils.logger import logger
 
 
+# Acknowledgment updates, kept as constants so every call reuses the same
+# prepared statement from the shared connection's statement cache
+_SQL_ACK_BY_ID = "UPDATE queries SET acknowledged = ?, acknowledged_time = ? WHERE id = ?"
+_SQL_ACK_BY_TEXT = '''
+    UPDATE queries SET acknowledged = ?, acknowledged_time = ? 
+    WHERE query_text = ? AND human_name = ? 
+    AND subscription_id = (SELECT id FROM subscriptions WHERE name = ?)
+'''
+
+# Both load paths read the same two result sets
+_SQL_LOAD_SUBSCRIPTIONS = "SELECT id, name, gug_name FROM subscriptions ORDER BY name, id"
+_SQL_LOAD_QUERIES = '''
+    SELECT id, query_text, human_name, display_name,
+           last_check_time, next_check_time, next_check_status,
+           paused, dead, checking_now, can_check_now,
+           checker_status, file_velocity_data, file_seed_cache_status, last_file_time,
+           COALESCE(acknowledged, 0), COALESCE(acknowledged_time, 0),
+           subscription_id
+    FROM queries
+    ORDER BY query_text
+'''
+
+# Dict keys for a query row; the trailing subscription_id column is left out by zip()
+_QUERY_COLUMNS = (
+    'id', 'query_text', 'human_name', 'display_name',
+    'last_check_time', 'next_check_time', 'next_check_status',
+    'paused', 'dead', 'checking_now', 'can_check_now',
+    'checker_status', 'file_velocity', 'file_seed_cache_status', 'last_file_time',
+    'acknowledged', 'acknowledged_time'
+)
+
+# Bumped whenever init_database gains a migration step; stored in PRAGMA user_version
+_SCHEMA_VERSION = 1
+
+# Minimum number of seconds between the automatic backups taken on save
+_AUTO_BACKUP_INTERVAL = 3600
+
+# Shared compact codecs for the file_velocity column; the empty list skips them entirely
+_encode_velocity = json.JSONEncoder(separators=(',', ':')).encode
+_decode_velocity = json.JSONDecoder().decode
+
+
+def _row_to_query(row: tuple) -> Dict[str, Any]:
+    """Build a query dict from a row of the load query"""
+    query = dict(zip(_QUERY_COLUMNS, row))
+    velocity = query['file_velocity']
+    query['file_velocity'] = _decode_velocity(velocity) if velocity and velocity != '[]' else []
+    return query
+
+
+def _query_from_row(row: tuple) -> Query:
+    """Build a Query directly from a row of the load query"""
+    velocity = row[12]
+    velocity = _decode_velocity(velocity) if velocity and velocity != '[]' else []
+    # Drop the trailing subscription_id column
+    return Query.from_row(row[:12] + (velocity,) + row[13:17])
+
+
 class DatabaseManager:
     def __init__(self, db_path: str = "hydrus_subscriptions.db", backup_enabled: bool = True, backup_count: int = 5):
         self.db_path = db_path
@@ -19,12 +80,35 @@ class DatabaseManager:
         self.api_backup_dir = Path("api_backups")
         self.backup_dir.mkdir(exist_ok=True)
         self.api_backup_dir.mkdir(exist_ok=True)
+        self._last_backup_ts: Optional[float] = None
+        
+        # Backup listings keyed by the directory mtime they were built at: (dir_mtime, list).
+        # The directory mtime only tracks added/removed files, so the create methods
+        # also reset these when they write a backup
+        self._backup_cache = (None, [])
+        self._api_backup_cache = (None, [])
+        
+        # One long-lived connection shared by the GUI and the API worker thread
+        self._lock = threading.Lock()
+        self._conn = self._connect()
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database with WAL and tuned PRAGMAs"""
+        # Autocommit mode; methods that batch writes issue their own BEGIN
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA busy_timeout=5000;
+        ''')
+        return conn
+    
     def init_database(self) -> None:
         """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
         # Create subscriptions table
         cursor.execute('''
@@ -63,11 +147,72 @@ class DatabaseManager:
             )
         ''')
         
-        # Add missing columns if they don't exist (for existing databases)
-        self._add_missing_columns(cursor)
+        # Migrate databases created by older versions, once per file
+        cursor.execute("PRAGMA user_version")
+        schema_version = cursor.fetchone()[0]
+        if schema_version < 1:
+            # Add missing columns if they don't exist (for existing databases)
+            self._add_missing_columns(cursor)
+        if schema_version < _SCHEMA_VERSION:
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        
+        # Back the text-match acknowledgment lookups and the subscription join.
+        # Plain (non-unique) indexes: subscription names are not unique in this schema
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_queries_sub_text_human
+            ON queries (subscription_id, query_text, human_name)
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_subscriptions_name_lookup ON subscriptions (name)")
         
-        conn.commit()
-        conn.close()
+        # Gather planner statistics once, the first time the indexes exist
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if cursor.fetchone() is None:
+            cursor.execute("ANALYZE")
+    
+    @contextmanager
+    def write_transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run a block of writes in one transaction on the shared connection"""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+    
+    def close(self) -> None:
+        """Close the shared database connection"""
+        with self._lock:
+            # Refresh planner statistics for tables whose contents have changed a lot
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+    
+    def _backup_to(self, dest_path: str) -> None:
+        """Copy the live database to a standalone file through the online backup API"""
+        dst = sqlite3.connect(dest_path)
+        try:
+            with self._lock:
+                self._conn.backup(dst, pages=256)
+            # Backups are opened standalone, so don't leave them in WAL mode
+            dst.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            dst.close()
+    
+    def _restore_from_file(self, source_path: str) -> None:
+        """Copy a backup into the live database through the online backup API"""
+        # Writing through the connection keeps the WAL consistent for any other
+        # open connection, which a file copy over the database would not.
+        # Read-only but not immutable, so a WAL-mode backup's -wal file is honoured
+        src = sqlite3.connect(f"{Path(source_path).resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            with self._lock:
+                src.backup(self._conn)
+                # Older backups may predate the current schema
+                self.init_database()
+        finally:
+            src.close()
     
     def _add_missing_columns(self, cursor: sqlite3.Cursor) -> None:
         """Add missing columns for database migration"""
@@ -94,8 +239,11 @@ class DatabaseManager:
             backup_filename = f"hydrus_subscriptions_backup_{timestamp}.db"
             backup_path = self.backup_dir / backup_filename
             
-            # Copy database file
-            shutil.copy2(self.db_path, backup_path)
+            # Copy pages through the online backup API; no WAL checkpoint needed
+            self._backup_to(str(backup_path))
+            self._last_backup_ts = time.monotonic()
+            # Overwriting a same-second backup leaves the directory mtime unchanged
+            self._backup_cache = (None, [])
             logger.info(f"Database backup created: {backup_path}")
             
             # Clean up old backups
@@ -106,19 +254,27 @@ class DatabaseManager:
             logger.error(f"Failed to create backup: {str(e)}")
             return None
     
+    @staticmethod
+    def _scan_backups(directory: Path, prefix: str) -> List[os.DirEntry]:
+        """List the backup files in a directory, newest first"""
+        with os.scandir(directory) as it:
+            entries = [entry for entry in it
+                       if entry.name.startswith(prefix) and entry.name.endswith(".db")]
+        
+        # DirEntry caches its stat result, so each file is stat'ed once
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        return entries
+    
     def _cleanup_old_backups(self):
         """Remove old backup files, keeping only the specified count"""
         try:
-            # Get all backup files
-            backup_files = list(self.backup_dir.glob("hydrus_subscriptions_backup_*.db"))
-            
-            # Sort by modification time (newest first)
-            backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+            # Get all backup files (newest first)
+            backup_files = self._scan_backups(self.backup_dir, "hydrus_subscriptions_backup_")
             
             # Remove excess backups
             for backup_file in backup_files[self.backup_count:]:
-                backup_file.unlink()
-                logger.info(f"Removed old backup: {backup_file}")
+                os.unlink(backup_file.path)
+                logger.info(f"Removed old backup: {backup_file.path}")
                 
         except Exception as e:
             logger.error(f"Failed to cleanup old backups: {str(e)}")
@@ -128,19 +284,25 @@ class DatabaseManager:
         backup_files = []
         
         try:
-            for backup_file in self.backup_dir.glob("hydrus_subscriptions_backup_*.db"):
+            # Adding or removing a backup bumps the directory mtime
+            dir_mtime = self.backup_dir.stat().st_mtime_ns
+            if self._backup_cache[0] == dir_mtime:
+                return list(self._backup_cache[1])
+            
+            # Already sorted by modification time (newest first)
+            for backup_file in self._scan_backups(self.backup_dir, "hydrus_subscriptions_backup_"):
                 stat = backup_file.stat()
+                created = datetime.datetime.fromtimestamp(stat.st_mtime)
                 backup_info = {
-                    'path': str(backup_file),
+                    'path': backup_file.path,
                     'filename': backup_file.name,
                     'size': stat.st_size,
-                    'created': datetime.datetime.fromtimestamp(stat.st_mtime),
-                    'created_str': datetime.datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+                    'created': created,
+                    'created_str': created.strftime("%Y-%m-%d %H:%M:%S")
                 }
                 backup_files.append(backup_info)
             
-            # Sort by creation time (newest first)
-            backup_files.sort(key=lambda x: x['created'], reverse=True)
+            self._backup_cache = (dir_mtime, list(backup_files))
             
         except Exception as e:
             logger.error(f"Failed to get backup files: {str(e)}")
@@ -160,7 +322,7 @@ class DatabaseManager:
                 logger.info(f"Current database backed up before restore: {current_backup}")
             
             # Copy backup file to current database location
-            shutil.copy2(backup_path, self.db_path)
+            self._restore_from_file(backup_path)
             logger.info(f"Database restored from backup: {backup_path}")
             
             return True
@@ -171,178 +333,169 @@ class DatabaseManager:
 
     def save_subscription_data(self, data: Dict[str, Any]) -> bool:
         """Save API data to database"""
-        # Create backup before saving new data
-        if self.backup_enabled:
+        # Automatic backups are throttled; manual backups go through create_backup directly
+        if self.backup_enabled and (self._last_backup_ts is None or
+                                    time.monotonic() - self._last_backup_ts >= _AUTO_BACKUP_INTERVAL):
             backup_path = self.create_backup()
             if backup_path:
                 logger.info(f"Created backup before API update: {backup_path}")
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            # Clear existing data
-            cursor.execute("DELETE FROM queries")
-            cursor.execute("DELETE FROM subscriptions")
+        with self._lock:
+            cursor = self._conn.cursor()
             
-            subscriptions = data.get('subscriptions', [])
-            
-            for sub in subscriptions:
-                # Insert subscription
-                cursor.execute('''
+            try:
+                # One write transaction for the whole replace
+                cursor.execute("BEGIN IMMEDIATE")
+                
+                # Clear existing data
+                cursor.execute("DELETE FROM queries")
+                cursor.execute("DELETE FROM subscriptions")
+                
+                subscriptions = data.get('subscriptions', [])
+                now = datetime.datetime.now()
+                
+                cursor.executemany('''
                     INSERT INTO subscriptions (name, gug_name, updated_at)
                     VALUES (?, ?, ?)
-                ''', (
-                    sub.get('name', 'Unknown'),
-                    sub.get('gug_name', ''),
-                    datetime.datetime.now()
-                ))
+                ''', [(sub.get('name', 'Unknown'), sub.get('gug_name', ''), now) for sub in subscriptions])
                 
-                sub_id = cursor.lastrowid
+                # The table was emptied above, so the new ids come back in insert order
+                cursor.execute("SELECT id FROM subscriptions ORDER BY id")
+                sub_ids = [row[0] for row in cursor.fetchall()]
                 
-                # Insert queries for this subscription
-                queries = sub.get('queries', [])
-                for query in queries:
-                    cursor.execute('''
-                        INSERT INTO queries (
-                            subscription_id, query_text, human_name, display_name,
-                            last_check_time, next_check_time, next_check_status,
-                            paused, dead, checking_now, can_check_now, checker_status,
-                            file_velocity_data, file_seed_cache_status, last_file_time, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        sub_id,
-                        query.get('query_text', ''),
-                        query.get('human_name', ''),
-                        query.get('display_name', ''),
-                        query.get('last_check_time', 0),
-                        query.get('next_check_time', 0),
-                        query.get('next_check_status', ''),
-                        query.get('paused', False),
-                        query.get('dead', False),
-                        query.get('checking_now', False),
-                        query.get('can_check_now', False),
-                        query.get('checker_status', 0),
-                        json.dumps(query.get('file_velocity', [])),
-                        query.get('file_seed_cache_status', ''),
-                        query.get('last_file_time', 0),
-                        datetime.datetime.now()
-                    ))
-            
-            conn.commit()
-            return True
-            
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+                # Stream every query straight from the parsed response into one
+                # executemany, without an intermediate row list
+                cursor.executemany('''
+                    INSERT INTO queries (
+                        subscription_id, query_text, human_name, display_name,
+                        last_check_time, next_check_time, next_check_status,
+                        paused, dead, checking_now, can_check_now, checker_status,
+                        file_velocity_data, file_seed_cache_status, last_file_time, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', ((
+                    sub_id,
+                    query.get('query_text', ''),
+                    query.get('human_name', ''),
+                    query.get('display_name', ''),
+                    query.get('last_check_time', 0),
+                    query.get('next_check_time', 0),
+                    query.get('next_check_status', ''),
+                    query.get('paused', False),
+                    query.get('dead', False),
+                    query.get('checking_now', False),
+                    query.get('can_check_now', False),
+                    query.get('checker_status', 0),
+                    _encode_velocity(query['file_velocity']) if query.get('file_velocity') else '[]',
+                    query.get('file_seed_cache_status', ''),
+                    query.get('last_file_time', 0),
+                    now
+                ) for sub_id, sub in zip(sub_ids, subscriptions) for query in sub.get('queries', [])))
+                
+                self._conn.commit()
+                return True
+                
+            except Exception as e:
+                self._conn.rollback()
+                raise e
     
     def load_subscription_data(self) -> Dict[str, Any]:
         """Load subscription data from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            # Get all subscriptions with their queries
-            cursor.execute('''
-                SELECT s.id, s.name, s.gug_name, s.updated_at,
-                       q.id, q.query_text, q.human_name, q.display_name,
-                       q.last_check_time, q.next_check_time, q.next_check_status,
-                       q.paused, q.dead, q.checking_now, q.can_check_now,
-                       q.checker_status, q.file_velocity_data, q.file_seed_cache_status, q.last_file_time,
-                       q.acknowledged, q.acknowledged_time
-                FROM subscriptions s
-                LEFT JOIN queries q ON s.id = q.subscription_id
-                ORDER BY s.name, q.query_text
-            ''')
-            
-            rows = cursor.fetchall()
-            
-            # Group data by subscription
-            subscriptions_dict = {}
-            
-            for row in rows:
-                sub_id = row[0]
-                if sub_id not in subscriptions_dict:
-                    subscriptions_dict[sub_id] = {
-                        'name': row[1],
-                        'gug_name': row[2],
-                        'queries': []
-                    }
-                
-                # Add query if it exists (LEFT JOIN might have NULL queries)
-                if row[5] is not None:  # query_text
-                    query_data = {
-                        'id': row[4],
-                        'query_text': row[5],
-                        'human_name': row[6],
-                        'display_name': row[7],
-                        'last_check_time': row[8],
-                        'next_check_time': row[9],
-                        'next_check_status': row[10],
-                        'paused': bool(row[11]),
-                        'dead': bool(row[12]),
-                        'checking_now': bool(row[13]),
-                        'can_check_now': bool(row[14]),
-                        'checker_status': row[15],
-                        'file_velocity': json.loads(row[16]) if row[16] else [],
-                        'file_seed_cache_status': row[17],
-                        'last_file_time': row[18],
-                        'acknowledged': bool(row[19]) if row[19] is not None else False,
-                        'acknowledged_time': row[20] if row[20] is not None else 0
-                    }
-                    subscriptions_dict[sub_id]['queries'].append(query_data)
+        with self._lock:
+            cursor = self._conn.cursor()
             
-            return {
-                'subscriptions': list(subscriptions_dict.values()),
-                'version': 80,  # Default version
-                'hydrus_version': 'From Database'
-            }
+            try:
+                cursor.execute(_SQL_LOAD_SUBSCRIPTIONS)
+                subscriptions_dict = {
+                    sub_id: {'name': name, 'gug_name': gug_name, 'queries': []}
+                    for sub_id, name, gug_name in cursor.fetchall()
+                }
+                
+                # Ordered by query text, so each subscription's list comes out sorted
+                cursor.execute(_SQL_LOAD_QUERIES)
+                
+                for row in cursor.fetchall():
+                    sub = subscriptions_dict.get(row[-1])
+                    if sub is not None:
+                        sub['queries'].append(_row_to_query(row))
+                
+                return {
+                    'subscriptions': list(subscriptions_dict.values()),
+                    'version': 80,  # Default version
+                    'hydrus_version': 'From Database'
+                }
+                
+            except Exception as e:
+                return {'subscriptions': [], 'version': 80, 'hydrus_version': 'Database Error'}
+    
+    def load_subscriptions(self) -> SubscriptionData:
+        """Load subscription data from database as model objects, skipping the dict form"""
+        with self._lock:
+            cursor = self._conn.cursor()
             
-        except Exception as e:
-            return {'subscriptions': [], 'version': 80, 'hydrus_version': 'Database Error'}
-        finally:
-            conn.close()
+            try:
+                cursor.execute(_SQL_LOAD_SUBSCRIPTIONS)
+                subscriptions_by_id = {
+                    sub_id: Subscription(name, gug_name, [])
+                    for sub_id, name, gug_name in cursor.fetchall()
+                }
+                
+                # Ordered by query text, so each subscription's list comes out sorted
+                cursor.execute(_SQL_LOAD_QUERIES)
+                
+                for row in cursor.fetchall():
+                    sub = subscriptions_by_id.get(row[-1])
+                    if sub is not None:
+                        sub.queries.append(_query_from_row(row))
+                
+                return SubscriptionData(list(subscriptions_by_id.values()), 80, 'From Database')
+                
+            except Exception as e:
+                return SubscriptionData([], 80, 'Database Error')
     
     def update_query_acknowledgment(self, query_id: int, acknowledged: bool, ack_time: int = 0) -> bool:
         """Update acknowledgment status for a specific query"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute(
-                "UPDATE queries SET acknowledged = ?, acknowledged_time = ? WHERE id = ?",
-                (acknowledged, ack_time, query_id)
-            )
-            conn.commit()
-            return cursor.rowcount > 0
-        except Exception:
-            conn.rollback()
-            return False
-        finally:
-            conn.close()
+        return self.update_query_acknowledgments_bulk([query_id], acknowledged, ack_time) > 0
+    
+    def update_query_acknowledgments_bulk(self, query_ids: List[int], acknowledged: bool, ack_time: int = 0) -> int:
+        """Update acknowledgment status for many queries in one transaction"""
+        with self._lock:
+            cursor = self._conn.cursor()
+            
+            try:
+                cursor.execute("BEGIN")
+                cursor.executemany(
+                    _SQL_ACK_BY_ID,
+                    [(acknowledged, ack_time, query_id) for query_id in query_ids]
+                )
+                self._conn.commit()
+                return cursor.rowcount
+            except Exception:
+                self._conn.rollback()
+                return 0
     
     def update_queries_by_text(self, query_text: str, human_name: str, 
                               subscription_name: str, acknowledged: bool, ack_time: int = 0) -> bool:
         """Update acknowledgment status by matching query text"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('''
-                UPDATE queries SET acknowledged = ?, acknowledged_time = ? 
-                WHERE query_text = ? AND human_name = ? 
-                AND subscription_id = (SELECT id FROM subscriptions WHERE name = ?)
-            ''', (acknowledged, ack_time, query_text, human_name, subscription_name))
-            
-            conn.commit()
-            return cursor.rowcount > 0
-        except Exception:
-            conn.rollback()
-            return False
-        finally:
-            conn.close()
+        return self.update_queries_by_text_bulk([(query_text, human_name, subscription_name)], acknowledged, ack_time) > 0
+    
+    def update_queries_by_text_bulk(self, keys: List[tuple], acknowledged: bool, ack_time: int = 0) -> int:
+        """Update acknowledgment status for many (query_text, human_name, subscription_name) keys in one transaction"""
+        with self._lock:
+            cursor = self._conn.cursor()
+            
+            try:
+                cursor.execute("BEGIN")
+                cursor.executemany(
+                    _SQL_ACK_BY_TEXT,
+                    [(acknowledged, ack_time, query_text, human_name, subscription_name)
+                     for query_text, human_name, subscription_name in keys]
+                )
+                
+                self._conn.commit()
+                return cursor.rowcount
+            except Exception:
+                self._conn.rollback()
+                return 0
     
     def create_api_backup(self) -> str:
         """Create a backup before API update in separate folder"""
@@ -351,7 +504,8 @@ class DatabaseManager:
         backup_path = self.api_backup_dir / backup_filename
         
         try:
-            shutil.copy2(self.db_path, backup_path)
+            self._backup_to(str(backup_path))
+            self._api_backup_cache = (None, [])
             logger.info(f"API backup created: {backup_path}")
             
             # Clean up old API backups (keep last 10)
@@ -365,16 +519,15 @@ class DatabaseManager:
     def _cleanup_api_backups(self):
         """Clean up old API backups, keeping only the most recent 10"""
         try:
-            backup_files = list(self.api_backup_dir.glob("api_backup_*.db"))
-            backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+            backup_files = self._scan_backups(self.api_backup_dir, "api_backup_")
             
             # Remove old backups beyond the limit
             for old_backup in backup_files[10:]:
                 try:
-                    old_backup.unlink()
-                    logger.info(f"Removed old API backup: {old_backup}")
+                    os.unlink(old_backup.path)
+                    logger.info(f"Removed old API backup: {old_backup.path}")
                 except Exception as e:
-                    logger.warning(f"Failed to remove old backup {old_backup}: {str(e)}")
+                    logger.warning(f"Failed to remove old backup {old_backup.path}: {str(e)}")
         except Exception as e:
             logger.warning(f"Failed to cleanup API backups: {str(e)}")
     
@@ -383,18 +536,20 @@ class DatabaseManager:
         backups = []
         
         try:
-            backup_files = list(self.api_backup_dir.glob("api_backup_*.db"))
-            backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+            # Reuse the last listing (and its per-file backup info) while the directory is unchanged
+            dir_mtime = self.api_backup_dir.stat().st_mtime_ns
+            if self._api_backup_cache[0] == dir_mtime:
+                return list(self._api_backup_cache[1])
             
-            for backup_file in backup_files:
+            for backup_file in self._scan_backups(self.api_backup_dir, "api_backup_"):
                 try:
                     stat = backup_file.stat()
                     
                     # Try to get backup info
-                    backup_info = self._get_backup_info(backup_file)
+                    backup_info = self._get_backup_info(Path(backup_file.path))
                     
                     backups.append({
-                        'path': str(backup_file),
+                        'path': backup_file.path,
                         'filename': backup_file.name,
                         'created': datetime.datetime.fromtimestamp(stat.st_mtime),
                         'size': stat.st_size,
@@ -403,7 +558,9 @@ class DatabaseManager:
                         'compatible': backup_info.get('compatible', False)
                     })
                 except Exception as e:
-                    logger.warning(f"Failed to read backup info for {backup_file}: {str(e)}")
+                    logger.warning(f"Failed to read backup info for {backup_file.path}: {str(e)}")
+            
+            self._api_backup_cache = (dir_mtime, list(backups))
                     
         except Exception as e:
             logger.error(f"Failed to list API backups: {str(e)}")
@@ -413,26 +570,24 @@ class DatabaseManager:
     def _get_backup_info(self, backup_path: Path) -> Dict[str, Any]:
         """Get information about a backup file"""
         try:
-            conn = sqlite3.connect(str(backup_path))
-            cursor = conn.cursor()
-            
-            # Check if tables exist (compatibility check)
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in cursor.fetchall()]
-            
-            compatible = 'subscriptions' in tables and 'queries' in tables
-            
-            subscription_count = 0
-            query_count = 0
-            
-            if compatible:
-                cursor.execute("SELECT COUNT(*) FROM subscriptions")
-                subscription_count = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM queries")
-                query_count = cursor.fetchone()[0]
-            
-            conn.close()
+            # Backups are never written, so skip locking entirely - unless an older
+            # file-copied backup still keeps committed rows in a -wal next to it
+            uri = f"{backup_path.resolve().as_uri()}?mode=ro"
+            if not os.path.exists(f"{backup_path}-wal"):
+                uri += "&immutable=1"
+            conn = sqlite3.connect(uri, uri=True)
+            try:
+                # A missing table makes the backup incompatible (compatibility check)
+                subscription_count, query_count = conn.execute(
+                    "SELECT (SELECT COUNT(*) FROM subscriptions), (SELECT COUNT(*) FROM queries)"
+                ).fetchone()
+                compatible = True
+            except sqlite3.OperationalError:
+                compatible = False
+                subscription_count = 0
+                query_count = 0
+            finally:
+                conn.close()
             
             return {
                 'compatible': compatible,
@@ -458,11 +613,11 @@ class DatabaseManager:
             
             # Create a backup of current database before restore
             current_backup = f"{self.db_path}.restore_backup_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            shutil.copy2(self.db_path, current_backup)
+            self._backup_to(current_backup)
             logger.info(f"Created restore backup: {current_backup}")
             
             # Restore from backup
-            shutil.copy2(backup_path, self.db_path)
+            self._restore_from_file(backup_path)
             logger.info(f"Database restored from: {backup_path}")
             
             return True
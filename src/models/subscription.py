@@ -1,12 +1,26 @@
 #!/usr/bin/env python3
-from dataclasses import dataclass
-from typing import List, Optional, Any, Dict
+from dataclasses import dataclass, field
+from typing import List, Optional, Any, Dict, Iterator, Sequence
 import datetime
+import sys
 
 
-@dataclass
+# Sort key offsets for the "Never" and acknowledged tiers; timestamps stay
+# well below 2**40, so the tier packs above them in a single int
+_TIER_NEVER = 1 << 40
+_TIER_ACKNOWLEDGED = 2 << 40
+
+# Slotted dataclasses need Python 3.10; older interpreters keep a per-instance __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Query:
-    """Data model for a subscription query"""
+    """Data model for a subscription query
+    
+    Treat instances as read-only: sort_key is cached on first use, so
+    controllers reload from the database instead of mutating fields.
+    """
     id: Optional[int]
     query_text: str
     human_name: str
@@ -24,6 +38,32 @@ class Query:
     last_file_time: int
     acknowledged: bool = False
     acknowledged_time: int = 0
+    _sort_key: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def sort_key(self) -> int:
+        """Priority order: normal queries oldest first, then "Never", then acknowledged"""
+        if self._sort_key is None:
+            # last_file_time may be None for API data without it or a NULL column
+            last_file_time = self.last_file_time or 0
+            if self.acknowledged:
+                self._sort_key = _TIER_ACKNOWLEDGED + last_file_time
+            else:
+                self._sort_key = last_file_time or _TIER_NEVER
+        return self._sort_key
+    
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> 'Query':
+        """Create Query instance from a database row with the columns in field order"""
+        (query_id, query_text, human_name, display_name, last_check_time, next_check_time,
+         next_check_status, paused, dead, checking_now, can_check_now, checker_status,
+         file_velocity, file_seed_cache_status, last_file_time, acknowledged, acknowledged_time) = row
+        return cls(
+            query_id, query_text, human_name, display_name, last_check_time, next_check_time,
+            next_check_status, bool(paused), bool(dead), bool(checking_now), bool(can_check_now),
+            checker_status, file_velocity, file_seed_cache_status, last_file_time,
+            bool(acknowledged), acknowledged_time
+        )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Query':
@@ -83,7 +123,7 @@ class Query:
         return self.acknowledged_time <= int(datetime.datetime.now().timestamp())
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Subscription:
     """Data model for a subscription"""
     name: str
@@ -116,20 +156,24 @@ class Subscription:
     @property
     def active_query_count(self) -> int:
         """Get number of non-acknowledged queries"""
-        return len([q for q in self.queries if not q.acknowledged])
+        return len(self.queries) - self.acknowledged_query_count
     
     @property
     def acknowledged_query_count(self) -> int:
         """Get number of acknowledged queries"""
-        return len([q for q in self.queries if q.acknowledged])
+        return sum(q.acknowledged for q in self.queries)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SubscriptionData:
     """Container for all subscription data"""
     subscriptions: List[Subscription]
     version: int
     hydrus_version: str
+    # (total, active) query counts, filled on first use; the data is replaced rather than mutated
+    _totals: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Name -> subscription index, built on first lookup for the same reason
+    _by_name: Optional[Dict[str, 'Subscription']] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SubscriptionData':
@@ -149,27 +193,37 @@ class SubscriptionData:
             'hydrus_version': self.hydrus_version
         }
     
+    def _get_totals(self) -> tuple:
+        """Count total and active queries in a single pass, once"""
+        if self._totals is None:
+            total = active = 0
+            for sub in self.subscriptions:
+                for query in sub.queries:
+                    total += 1
+                    active += not query.acknowledged
+            self._totals = (total, active)
+        return self._totals
+    
     @property
     def total_queries(self) -> int:
         """Get total number of queries across all subscriptions"""
-        return sum(s.query_count for s in self.subscriptions)
+        return self._get_totals()[0]
     
     @property
     def total_active_queries(self) -> int:
         """Get total number of active (non-acknowledged) queries"""
-        return sum(s.active_query_count for s in self.subscriptions)
+        return self._get_totals()[1]
     
     def get_subscription_by_name(self, name: str) -> Optional[Subscription]:
         """Get subscription by name"""
-        for sub in self.subscriptions:
-            if sub.name == name:
-                return sub
-        return None
+        if self._by_name is None:
+            # Reversed so the first subscription wins when names repeat
+            self._by_name = {sub.name: sub for sub in reversed(self.subscriptions)}
+        return self._by_name.get(name)
     
-    def get_all_queries(self) -> List[tuple[str, Query]]:
-        """Get all queries with their subscription names"""
-        all_queries = []
+    def get_all_queries(self) -> Iterator[tuple[str, Query]]:
+        """Yield all queries with their subscription names"""
         for sub in self.subscriptions:
+            name = sub.name
             for query in sub.queries:
-                all_queries.append((sub.name, query))
-        return all_queries
\ No newline at end of file
+                yield name, query
\ No newline at end of file
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 import datetime
+from functools import lru_cache
 from PyQt6.QtGui import QColor
 
 
+@lru_cache(maxsize=4096)
 def format_timestamp(timestamp: int) -> str:
-    """Convert Unix timestamp to readable format"""
+    """Convert Unix timestamp to readable format (cached; rows share many timestamps)"""
     try:
         dt = datetime.datetime.fromtimestamp(timestamp)
         return dt.strftime("%Y-%m-%d %H:%M")
@@ -12,28 +14,29 @@ def format_timestamp(timestamp: int) -> str:
         return str(timestamp)
 
 
+# Orange gradient: newer files = light orange, older files = dark orange
+# Light orange: RGB(255, 240, 200)
+# Dark orange: RGB(255, 140, 60)
+# Precomputed for 256 age steps (0 = newest, 255 = oldest); QColor is a value
+# type, so callers receive copies when they set it on an item
+_AGE_LUT = [QColor(255, 240 - (i * 100) // 255, 200 - (i * 140) // 255) for i in range(256)]
+_NEUTRAL = QColor(240, 240, 240)
+_MEDIUM = QColor(255, 220, 180)
+
+
 def get_color_for_age(last_file_time: int, min_time: int, max_time: int) -> QColor:
     """Calculate color based on file age - darker orange for older files"""
     if last_file_time == 0:
         # Dead/never files get a neutral gray
-        return QColor(240, 240, 240)
+        return _NEUTRAL
     
     if min_time == max_time:
         # All files have same timestamp, use medium orange
-        return QColor(255, 220, 180)
-    
-    # Calculate age ratio (0 = newest, 1 = oldest)
-    age_ratio = (max_time - last_file_time) / (max_time - min_time)
-    
-    # Orange gradient: newer files = light orange, older files = dark orange
-    # Light orange: RGB(255, 240, 200) 
-    # Dark orange: RGB(255, 140, 60)
-    
-    red = 255  # Keep red constant
-    green = int(240 - (age_ratio * 100))  # 240 -> 140
-    blue = int(200 - (age_ratio * 140))   # 200 -> 60
+        return _MEDIUM
     
-    return QColor(red, green, blue)
+    # Quantized age ratio, clamped for times outside the range (e.g. expired acknowledgments)
+    index = ((max_time - last_file_time) * 255) // (max_time - min_time)
+    return _AGE_LUT[min(max(index, 0), 255)]
 
 
 def get_status_color(query, ack_time: int, now: int) -> QColor:
@@ -49,25 +49,29 @@ class Logger:
         self._logger.addHandler(file_handler)
         self._logger.addHandler(console_handler)
     
-    def debug(self, message: str):
+    def isEnabledFor(self, level: int) -> bool:
+        """Check if a message of this level would be handled"""
+        return self._logger.isEnabledFor(level)
+    
+    def debug(self, message: str, *args):
         """Log debug message"""
-        self._logger.debug(message)
+        self._logger.debug(message, *args)
     
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """Log info message"""
-        self._logger.info(message)
+        self._logger.info(message, *args)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """Log warning message"""
-        self._logger.warning(message)
+        self._logger.warning(message, *args)
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """Log error message"""
-        self._logger.error(message)
+        self._logger.error(message, *args)
     
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """Log critical message"""
-        self._logger.critical(message)
+        self._logger.critical(message, *args)
 
 
 # Global logger instance
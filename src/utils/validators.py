@@ -5,6 +5,9 @@ from typing import Optional, Tuple
 from urllib.parse import urlparse
 
 
+_API_KEY_RE = re.compile(r'^[a-f0-9]{64}$')
+
+
 def validate_api_key(api_key: str) -> Tuple[bool, Optional[str]]:
     """Validate Hydrus API key format"""
     if not api_key:
@@ -13,7 +16,7 @@ def validate_api_key(api_key: str) -> Tuple[bool, Optional[str]]:
     if len(api_key) != 64:
         return False, "API key must be 64 characters long"
     
-    if not re.match(r'^[a-f0-9]{64}$', api_key):
+    if not _API_KEY_RE.match(api_key):
         return False, "API key must contain only lowercase hexadecimal characters"
     
     return True, None
@@ -465,4 +465,9 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Save window geometry on close"""
         self.settings.setValue("geometry", self.saveGeometry())
+        # Write settings now, the process exits without running destructors
+        self.settings.sync()
+        if self.controller.api_controller:
+            self.controller.api_controller.close()
+        self.controller.db_manager.close()
         super().closeEvent(event)
\ No newline at end of file
@@ -252,6 +252,8 @@ class SettingsDialog(QDialog):
         api_controller = ApiController(temp_db, temp_config)
         
         success, error_msg = api_controller.test_connection()
+        api_controller.close()
+        temp_db.close()
         
         if success:
             QMessageBox.information(self, "Connection Test", "API connection successful!")